@@ -30,15 +30,17 @@ import compatibility_check
 from btcrecover import btcrpass, success_alert
 import sys, multiprocessing
 
-if __name__ == "__main__":
+
+def main(argv):
+    """Run a password recovery with *argv* and return the process exit code."""
     print()
     print(
         "Starting",
         btcrpass.full_version(),
-        file=sys.stderr if any(a.startswith("--listp") for a in sys.argv[1:]) else sys.stdout,
+        file=sys.stderr if any(a.startswith("--listp") for a in argv) else sys.stdout,
     )  # --listpass
 
-    btcrpass.parse_arguments(sys.argv[1:])
+    btcrpass.parse_arguments(argv)
     (password_found, not_found_msg) = btcrpass.main()
 
     if isinstance(password_found, str):
@@ -70,4 +72,8 @@ if __name__ == "__main__":
 
     success_alert.stop_success_beep()
 
-    sys.exit(retval)
+    return retval
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -3,8 +3,21 @@
 from __future__ import annotations
 
 import hashlib
+import hmac
+import os
+import struct
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from functools import lru_cache, reduce
+from itertools import islice
+from operator import xor
+from typing import Callable, Iterable, Iterator, Sequence, Tuple
+
+try:
+    import google_crc32c  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    google_crc32c = None  # type: ignore
 
 __all__ = [
     "DEFAULT_PASSPHRASE",
@@ -12,11 +25,14 @@ __all__ = [
     "InvalidMnemonicError",
     "InvalidPassphraseError",
     "decode_mnemonic",
+    "decode_mnemonic_batch",
     "mnemonic_to_bytes",
+    "try_passphrases",
     "validate_mnemonic",
 ]
 
 DEFAULT_PASSPHRASE = "aezeed"
+_DEFAULT_PASS_BYTES = DEFAULT_PASSPHRASE.encode("utf-8")
 
 EncipheredCipherSeedSize = 33
 DecipheredCipherSeedSize = 19
@@ -46,34 +62,63 @@ class DecipheredCipherSeed:
     birthday: int
 
 
-_CRC32C_POLY = 0x82F63B78
-
-
-def _crc32c_table() -> List[int]:
-    table: List[int] = []
-    for i in range(256):
-        crc = i
-        for _ in range(8):
-            if crc & 1:
-                crc = (crc >> 1) ^ _CRC32C_POLY
-            else:
-                crc >>= 1
-        table.append(crc & 0xFFFFFFFF)
-    return table
-
-
-_CRC32C_TABLE = _crc32c_table()
-
-
-def _crc32c(data: bytes) -> int:
+# CRC-32C (Castagnoli, reflected polynomial 0x82F63B78) lookup table.
+_CRC32C_TABLE = (
+    0X00000000, 0XF26B8303, 0XE13B70F7, 0X1350F3F4, 0XC79A971F, 0X35F1141C, 0X26A1E7E8, 0XD4CA64EB,
+    0X8AD958CF, 0X78B2DBCC, 0X6BE22838, 0X9989AB3B, 0X4D43CFD0, 0XBF284CD3, 0XAC78BF27, 0X5E133C24,
+    0X105EC76F, 0XE235446C, 0XF165B798, 0X030E349B, 0XD7C45070, 0X25AFD373, 0X36FF2087, 0XC494A384,
+    0X9A879FA0, 0X68EC1CA3, 0X7BBCEF57, 0X89D76C54, 0X5D1D08BF, 0XAF768BBC, 0XBC267848, 0X4E4DFB4B,
+    0X20BD8EDE, 0XD2D60DDD, 0XC186FE29, 0X33ED7D2A, 0XE72719C1, 0X154C9AC2, 0X061C6936, 0XF477EA35,
+    0XAA64D611, 0X580F5512, 0X4B5FA6E6, 0XB93425E5, 0X6DFE410E, 0X9F95C20D, 0X8CC531F9, 0X7EAEB2FA,
+    0X30E349B1, 0XC288CAB2, 0XD1D83946, 0X23B3BA45, 0XF779DEAE, 0X05125DAD, 0X1642AE59, 0XE4292D5A,
+    0XBA3A117E, 0X4851927D, 0X5B016189, 0XA96AE28A, 0X7DA08661, 0X8FCB0562, 0X9C9BF696, 0X6EF07595,
+    0X417B1DBC, 0XB3109EBF, 0XA0406D4B, 0X522BEE48, 0X86E18AA3, 0X748A09A0, 0X67DAFA54, 0X95B17957,
+    0XCBA24573, 0X39C9C670, 0X2A993584, 0XD8F2B687, 0X0C38D26C, 0XFE53516F, 0XED03A29B, 0X1F682198,
+    0X5125DAD3, 0XA34E59D0, 0XB01EAA24, 0X42752927, 0X96BF4DCC, 0X64D4CECF, 0X77843D3B, 0X85EFBE38,
+    0XDBFC821C, 0X2997011F, 0X3AC7F2EB, 0XC8AC71E8, 0X1C661503, 0XEE0D9600, 0XFD5D65F4, 0X0F36E6F7,
+    0X61C69362, 0X93AD1061, 0X80FDE395, 0X72966096, 0XA65C047D, 0X5437877E, 0X4767748A, 0XB50CF789,
+    0XEB1FCBAD, 0X197448AE, 0X0A24BB5A, 0XF84F3859, 0X2C855CB2, 0XDEEEDFB1, 0XCDBE2C45, 0X3FD5AF46,
+    0X7198540D, 0X83F3D70E, 0X90A324FA, 0X62C8A7F9, 0XB602C312, 0X44694011, 0X5739B3E5, 0XA55230E6,
+    0XFB410CC2, 0X092A8FC1, 0X1A7A7C35, 0XE811FF36, 0X3CDB9BDD, 0XCEB018DE, 0XDDE0EB2A, 0X2F8B6829,
+    0X82F63B78, 0X709DB87B, 0X63CD4B8F, 0X91A6C88C, 0X456CAC67, 0XB7072F64, 0XA457DC90, 0X563C5F93,
+    0X082F63B7, 0XFA44E0B4, 0XE9141340, 0X1B7F9043, 0XCFB5F4A8, 0X3DDE77AB, 0X2E8E845F, 0XDCE5075C,
+    0X92A8FC17, 0X60C37F14, 0X73938CE0, 0X81F80FE3, 0X55326B08, 0XA759E80B, 0XB4091BFF, 0X466298FC,
+    0X1871A4D8, 0XEA1A27DB, 0XF94AD42F, 0X0B21572C, 0XDFEB33C7, 0X2D80B0C4, 0X3ED04330, 0XCCBBC033,
+    0XA24BB5A6, 0X502036A5, 0X4370C551, 0XB11B4652, 0X65D122B9, 0X97BAA1BA, 0X84EA524E, 0X7681D14D,
+    0X2892ED69, 0XDAF96E6A, 0XC9A99D9E, 0X3BC21E9D, 0XEF087A76, 0X1D63F975, 0X0E330A81, 0XFC588982,
+    0XB21572C9, 0X407EF1CA, 0X532E023E, 0XA145813D, 0X758FE5D6, 0X87E466D5, 0X94B49521, 0X66DF1622,
+    0X38CC2A06, 0XCAA7A905, 0XD9F75AF1, 0X2B9CD9F2, 0XFF56BD19, 0X0D3D3E1A, 0X1E6DCDEE, 0XEC064EED,
+    0XC38D26C4, 0X31E6A5C7, 0X22B65633, 0XD0DDD530, 0X0417B1DB, 0XF67C32D8, 0XE52CC12C, 0X1747422F,
+    0X49547E0B, 0XBB3FFD08, 0XA86F0EFC, 0X5A048DFF, 0X8ECEE914, 0X7CA56A17, 0X6FF599E3, 0X9D9E1AE0,
+    0XD3D3E1AB, 0X21B862A8, 0X32E8915C, 0XC083125F, 0X144976B4, 0XE622F5B7, 0XF5720643, 0X07198540,
+    0X590AB964, 0XAB613A67, 0XB831C993, 0X4A5A4A90, 0X9E902E7B, 0X6CFBAD78, 0X7FAB5E8C, 0X8DC0DD8F,
+    0XE330A81A, 0X115B2B19, 0X020BD8ED, 0XF0605BEE, 0X24AA3F05, 0XD6C1BC06, 0XC5914FF2, 0X37FACCF1,
+    0X69E9F0D5, 0X9B8273D6, 0X88D28022, 0X7AB90321, 0XAE7367CA, 0X5C18E4C9, 0X4F48173D, 0XBD23943E,
+    0XF36E6F75, 0X0105EC76, 0X12551F82, 0XE03E9C81, 0X34F4F86A, 0XC69F7B69, 0XD5CF889D, 0X27A40B9E,
+    0X79B737BA, 0X8BDCB4B9, 0X988C474D, 0X6AE7C44E, 0XBE2DA0A5, 0X4C4623A6, 0X5F16D052, 0XAD7D5351,
+)
+
+
+def _crc32c_table(data: bytes) -> int:
+    table = _CRC32C_TABLE
     crc = 0xFFFFFFFF
     for b in data:
-        crc = _CRC32C_TABLE[(crc ^ b) & 0xFF] ^ (crc >> 8)
-    return (~crc) & 0xFFFFFFFF
+        crc = table[(crc ^ b) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+# Prefer the optional google-crc32c package when its native extension is
+# built (it uses the SSE4.2/ARMv8 CRC32C instructions); its pure-Python
+# fallback is slower than the table loop above, so ignore that one.
+if google_crc32c is not None and getattr(google_crc32c, "implementation", None) == "c":
+    _crc32c = google_crc32c.value
+else:
+    _crc32c = _crc32c_table
 
 
 BLOCK_SIZE = 16
 EXTRACTED_KEY_SIZE = 3 * BLOCK_SIZE
+_BLOCK_MASK = (1 << (8 * BLOCK_SIZE)) - 1
 
 
 def _mk_block(size: int = BLOCK_SIZE) -> bytearray:
@@ -81,37 +126,51 @@ def _mk_block(size: int = BLOCK_SIZE) -> bytearray:
 
 
 ZERO_BLOCK = _mk_block()
+# Immutable zero template for clearing scratch blocks by slice assignment.
+_ZERO16 = bytes(BLOCK_SIZE)
 
 
+# The 16-byte XOR helpers work on whole blocks as 128-bit integers, which
+# replaces sixteen interpreted byte operations with a single bignum XOR.
 def _xor_bytes1x16(a: Sequence[int], b: Sequence[int], dst: bytearray) -> None:
-    for i in range(BLOCK_SIZE):
-        dst[i] = a[i] ^ b[i]
+    dst[:] = (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(
+        BLOCK_SIZE, "little"
+    )
 
 
 def _xor_bytes4x16(
     a: Sequence[int], b: Sequence[int], c: Sequence[int], d: Sequence[int], dst: bytearray
 ) -> None:
-    for i in range(BLOCK_SIZE):
-        dst[i] = a[i] ^ b[i] ^ c[i] ^ d[i]
+    dst[:] = (
+        int.from_bytes(a, "little")
+        ^ int.from_bytes(b, "little")
+        ^ int.from_bytes(c, "little")
+        ^ int.from_bytes(d, "little")
+    ).to_bytes(BLOCK_SIZE, "little")
 
 
 def _xor_bytes(a: Sequence[int], b: Sequence[int], dst: bytearray) -> None:
-    for i in range(len(dst)):
-        dst[i] = a[i] ^ b[i]
+    # Same trick for arbitrary lengths; only the first len(dst) bytes of the
+    # operands take part, as in the original byte loop.
+    n = len(dst)
+    dst[:] = (
+        int.from_bytes(a[:n], "little") ^ int.from_bytes(b[:n], "little")
+    ).to_bytes(n, "little")
 
 
 def _uint32(i: int) -> int:
     return i & 0xFFFFFFFF
 
 
-def _uint8(i: int) -> int:
-    return i & 0xFF
+def _derive_key(key: bytes) -> bytes:
+    """Stretch arbitrary key material to the 48-byte AEZ key with BLAKE2b."""
+    return hashlib.blake2b(key, digest_size=EXTRACTED_KEY_SIZE).digest()
 
 
 def _extract_key(key: bytes) -> bytes:
     if len(key) == EXTRACTED_KEY_SIZE:
         return key
-    return hashlib.blake2b(key, digest_size=EXTRACTED_KEY_SIZE).digest()
+    return _derive_key(key)
 
 
 def _mult_block(x: int, src: Sequence[int], dst: bytearray) -> None:
@@ -127,21 +186,20 @@ def _mult_block(x: int, src: Sequence[int], dst: bytearray) -> None:
 
 
 def _double_block(p: bytearray) -> None:
-    tmp = p[0]
-    for i in range(15):
-        p[i] = ((p[i] << 1) | (p[i + 1] >> 7)) & 0xFF
-    p[15] = ((p[15] << 1) & 0xFE) ^ (0x87 if tmp & 0x80 else 0)
+    n = int.from_bytes(p, "big")
+    n = ((n << 1) & _BLOCK_MASK) ^ (0x87 if n >> 127 else 0)
+    p[:] = n.to_bytes(BLOCK_SIZE, "big")
 
 
 def _one_zero_pad(src: Sequence[int], size: int, dst: bytearray) -> None:
-    dst[:] = b"\x00" * len(dst)
+    dst[:] = _ZERO16[:len(dst)]
     if size:
         dst[:size] = src[:size]
     dst[size] = 0x80
 
 
 
-TE0 = [
+TE0 = (
     0XC66363A5, 0XF87C7C84, 0XEE777799, 0XF67B7B8D, 0XFFF2F20D, 0XD66B6BBD, 0XDE6F6FB1, 0X91C5C554,
     0X60303050, 0X02010103, 0XCE6767A9, 0X562B2B7D, 0XE7FEFE19, 0XB5D7D762, 0X4DABABE6, 0XEC76769A,
     0X8FCACA45, 0X1F82829D, 0X89C9C940, 0XFA7D7D87, 0XEFFAFA15, 0XB25959EB, 0X8E4747C9, 0XFBF0F00B,
@@ -174,9 +232,9 @@ TE0 = [
     0X2D9B9BB6, 0X3C1E1E22, 0X15878792, 0XC9E9E920, 0X87CECE49, 0XAA5555FF, 0X50282878, 0XA5DFDF7A,
     0X038C8C8F, 0X59A1A1F8, 0X09898980, 0X1A0D0D17, 0X65BFBFDA, 0XD7E6E631, 0X844242C6, 0XD06868B8,
     0X824141C3, 0X299999B0, 0X5A2D2D77, 0X1E0F0F11, 0X7BB0B0CB, 0XA85454FC, 0X6DBBBBD6, 0X2C16163A,
-]
+)
 
-TE1 = [
+TE1 = (
     0XA5C66363, 0X84F87C7C, 0X99EE7777, 0X8DF67B7B, 0X0DFFF2F2, 0XBDD66B6B, 0XB1DE6F6F, 0X5491C5C5,
     0X50603030, 0X03020101, 0XA9CE6767, 0X7D562B2B, 0X19E7FEFE, 0X62B5D7D7, 0XE64DABAB, 0X9AEC7676,
     0X458FCACA, 0X9D1F8282, 0X4089C9C9, 0X87FA7D7D, 0X15EFFAFA, 0XEBB25959, 0XC98E4747, 0X0BFBF0F0,
@@ -209,9 +267,9 @@ TE1 = [
     0XB62D9B9B, 0X223C1E1E, 0X92158787, 0X20C9E9E9, 0X4987CECE, 0XFFAA5555, 0X78502828, 0X7AA5DFDF,
     0X8F038C8C, 0XF859A1A1, 0X80098989, 0X171A0D0D, 0XDA65BFBF, 0X31D7E6E6, 0XC6844242, 0XB8D06868,
     0XC3824141, 0XB0299999, 0X775A2D2D, 0X111E0F0F, 0XCB7BB0B0, 0XFCA85454, 0XD66DBBBB, 0X3A2C1616,
-]
+)
 
-TE2 = [
+TE2 = (
     0X63A5C663, 0X7C84F87C, 0X7799EE77, 0X7B8DF67B, 0XF20DFFF2, 0X6BBDD66B, 0X6FB1DE6F, 0XC55491C5,
     0X30506030, 0X01030201, 0X67A9CE67, 0X2B7D562B, 0XFE19E7FE, 0XD762B5D7, 0XABE64DAB, 0X769AEC76,
     0XCA458FCA, 0X829D1F82, 0XC94089C9, 0X7D87FA7D, 0XFA15EFFA, 0X59EBB259, 0X47C98E47, 0XF00BFBF0,
@@ -244,9 +302,9 @@ TE2 = [
     0X9BB62D9B, 0X1E223C1E, 0X87921587, 0XE920C9E9, 0XCE4987CE, 0X55FFAA55, 0X28785028, 0XDF7AA5DF,
     0X8C8F038C, 0XA1F859A1, 0X89800989, 0X0D171A0D, 0XBFDA65BF, 0XE631D7E6, 0X42C68442, 0X68B8D068,
     0X41C38241, 0X99B02999, 0X2D775A2D, 0X0F111E0F, 0XB0CB7BB0, 0X54FCA854, 0XBBD66DBB, 0X163A2C16,
-]
+)
 
-TE3 = [
+TE3 = (
     0X6363A5C6, 0X7C7C84F8, 0X777799EE, 0X7B7B8DF6, 0XF2F20DFF, 0X6B6BBDD6, 0X6F6FB1DE, 0XC5C55491,
     0X30305060, 0X01010302, 0X6767A9CE, 0X2B2B7D56, 0XFEFE19E7, 0XD7D762B5, 0XABABE64D, 0X76769AEC,
     0XCACA458F, 0X82829D1F, 0XC9C94089, 0X7D7D87FA, 0XFAFA15EF, 0X5959EBB2, 0X4747C98E, 0XF0F00BFB,
@@ -279,22 +337,67 @@ TE3 = [
     0X9B9BB62D, 0X1E1E223C, 0X87879215, 0XE9E920C9, 0XCECE4987, 0X5555FFAA, 0X28287850, 0XDFDF7AA5,
     0X8C8C8F03, 0XA1A1F859, 0X89898009, 0X0D0D171A, 0XBFBFDA65, 0XE6E631D7, 0X4242C684, 0X6868B8D0,
     0X4141C382, 0X9999B029, 0X2D2D775A, 0X0F0F111E, 0XB0B0CB7B, 0X5454FCA8, 0XBBBBD66D, 0X16163A2C,
-]
-
-
-def _read_uint32_be(block: Sequence[int], offset: int) -> int:
-    return int.from_bytes(bytes(block[offset:offset + 4]), "big")
-
-
-def _write_uint32_be(block: bytearray, offset: int, value: int) -> None:
-    block[offset:offset + 4] = value.to_bytes(4, "big")
+)
+
+
+_UNPACK_KEY_WORDS = struct.Struct(">12I").unpack_from
+_UNPACK_BLOCK_WORDS = struct.Struct(">4I").unpack_from
+_PACK_BLOCK_WORDS = struct.Struct(">4I").pack_into
+
+
+def _make_rounds(
+    name: str, key_attr: str, rounds: int, int_block: bool = False
+) -> Callable[..., object]:
+    """Build a fully unrolled T-table round function for a fixed round count.
+
+    Every state word and table entry is already a uint32, so only the byte
+    extractions need masking.  The round keys are unpacked into locals once
+    per call, leaving only table lookups and XORs in the unrolled body.
+
+    By default the function encrypts a 16-byte block in place.  With
+    ``int_block`` it instead takes and returns the block as a 128-bit
+    big-endian integer, for callers that keep their state in int space.
+    """
+    key_names = [f"k{n}" for n in range(4 * rounds)]
+    if int_block:
+        signature = f"def {name}(self, n):"
+        load = "    s0, s1, s2, s3 = n >> 96, (n >> 64) & 0xFFFFFFFF, (n >> 32) & 0xFFFFFFFF, n & 0xFFFFFFFF"
+        store = "    return (s0 << 96) | (s1 << 64) | (s2 << 32) | s3"
+    else:
+        signature = f"def {name}(self, block):"
+        load = "    s0, s1, s2, s3 = _UNPACK_BLOCK_WORDS(block)"
+        store = "    _PACK_BLOCK_WORDS(block, 0, s0, s1, s2, s3)"
+    lines = [
+        signature,
+        "    te0, te1, te2, te3 = TE0, TE1, TE2, TE3",
+        f"    {', '.join(key_names)}, = self.{key_attr}",
+        load,
+    ]
+    for r in range(rounds):
+        k = 4 * r
+        lines.append(
+            "    s0, s1, s2, s3 = ("
+            f"te0[s0 >> 24] ^ te1[(s1 >> 16) & 0xFF] ^ te2[(s2 >> 8) & 0xFF] ^ te3[s3 & 0xFF] ^ k{k}, "
+            f"te0[s1 >> 24] ^ te1[(s2 >> 16) & 0xFF] ^ te2[(s3 >> 8) & 0xFF] ^ te3[s0 & 0xFF] ^ k{k + 1}, "
+            f"te0[s2 >> 24] ^ te1[(s3 >> 16) & 0xFF] ^ te2[(s0 >> 8) & 0xFF] ^ te3[s1 & 0xFF] ^ k{k + 2}, "
+            f"te0[s3 >> 24] ^ te1[(s0 >> 16) & 0xFF] ^ te2[(s1 >> 8) & 0xFF] ^ te3[s2 & 0xFF] ^ k{k + 3})"
+        )
+    lines.append(store)
+    namespace: dict = {}
+    exec("\n".join(lines), globals(), namespace)
+    return namespace[name]
 
 
 class _AESRound:
     def __init__(self, key: bytes) -> None:
-        words = [_read_uint32_be(key, 4 * i) for i in range(12)]
         self.aes10_key = [0] * (4 * 10)
         self.aes4_key = [0] * (4 * 4)
+        self._scratch = _mk_block()
+        self.load_key(key)
+
+    def load_key(self, key: bytes) -> None:
+        """Repopulate the round keys in place from a 48-byte extracted key."""
+        words = _UNPACK_KEY_WORDS(key)
         self.aes10_key[0:12] = words
         self.aes10_key[12:24] = words
         self.aes10_key[24:36] = words
@@ -304,10 +407,8 @@ class _AESRound:
         self.aes4_key[8:12] = words[8:12]
 
     def reset(self) -> None:
-        for i in range(len(self.aes10_key)):
-            self.aes10_key[i] = 0
-        for i in range(len(self.aes4_key)):
-            self.aes4_key[i] = 0
+        self.aes10_key[:] = [0] * len(self.aes10_key)
+        self.aes4_key[:] = [0] * len(self.aes4_key)
 
     def AES4(
         self,
@@ -318,78 +419,98 @@ class _AESRound:
         dst: bytearray,
     ) -> None:
         _xor_bytes4x16(j, i_vec, l_vec, src, dst)
-        self.rounds(dst, 4)
+        self.rounds4(dst)
+
+    def AES4_xor(
+        self,
+        j: Sequence[int],
+        i_vec: Sequence[int],
+        l_vec: Sequence[int],
+        src: Sequence[int],
+        acc: bytearray,
+    ) -> None:
+        """Run AES4 and XOR the result into ``acc`` without a caller-side temporary."""
+        block = self._scratch
+        _xor_bytes4x16(j, i_vec, l_vec, src, block)
+        self.rounds4(block)
+        _xor_bytes1x16(acc, block, acc)
+
+    def AES4_int(self, j: int, i_vec: int, l_vec: int, src: int) -> int:
+        """AES4 over 128-bit big-endian integers, returning the result."""
+        return self.rounds4_int(j ^ i_vec ^ l_vec ^ src)
+
+    def AES10_int(self, l_vec: int, src: int) -> int:
+        """AES10 over 128-bit big-endian integers, returning the result."""
+        return self.rounds10_int(src ^ l_vec)
 
     def AES10(self, l_vec: Sequence[int], src: Sequence[int], dst: bytearray) -> None:
         _xor_bytes1x16(src, l_vec, dst)
-        self.rounds(dst, 10)
+        self.rounds10(dst)
 
     def rounds(self, block: bytearray, rounds: int) -> None:
-        keys = self.aes4_key if rounds == 4 else self.aes10_key
-        s0 = _read_uint32_be(block, 0)
-        s1 = _read_uint32_be(block, 4)
-        s2 = _read_uint32_be(block, 8)
-        s3 = _read_uint32_be(block, 12)
-
-        for r in range(rounds):
-            rk_off = r * 4
-            t0 = (
-                TE0[_uint8(s0 >> 24)]
-                ^ TE1[_uint8(s1 >> 16)]
-                ^ TE2[_uint8(s2 >> 8)]
-                ^ TE3[_uint8(s3)]
-                ^ keys[rk_off]
-            )
-            t1 = (
-                TE0[_uint8(s1 >> 24)]
-                ^ TE1[_uint8(s2 >> 16)]
-                ^ TE2[_uint8(s3 >> 8)]
-                ^ TE3[_uint8(s0)]
-                ^ keys[rk_off + 1]
-            )
-            t2 = (
-                TE0[_uint8(s2 >> 24)]
-                ^ TE1[_uint8(s3 >> 16)]
-                ^ TE2[_uint8(s0 >> 8)]
-                ^ TE3[_uint8(s1)]
-                ^ keys[rk_off + 2]
-            )
-            t3 = (
-                TE0[_uint8(s3 >> 24)]
-                ^ TE1[_uint8(s0 >> 16)]
-                ^ TE2[_uint8(s1 >> 8)]
-                ^ TE3[_uint8(s2)]
-                ^ keys[rk_off + 3]
-            )
-            s0 = _uint32(t0)
-            s1 = _uint32(t1)
-            s2 = _uint32(t2)
-            s3 = _uint32(t3)
-
-        _write_uint32_be(block, 0, s0)
-        _write_uint32_be(block, 4, s1)
-        _write_uint32_be(block, 8, s2)
-        _write_uint32_be(block, 12, s3)
+        if rounds == 4:
+            self.rounds4(block)
+        elif rounds == 10:
+            self.rounds10(block)
+        else:
+            raise ValueError(f"unsupported AES round count: {rounds}")
+
+    rounds4 = _make_rounds("rounds4", "aes4_key", 4)
+    rounds10 = _make_rounds("rounds10", "aes10_key", 10)
+    rounds4_int = _make_rounds("rounds4_int", "aes4_key", 4, int_block=True)
+    rounds10_int = _make_rounds("rounds10_int", "aes10_key", 10, int_block=True)
+
 
 
 
+# Block offsets of the key-derived I, J, L, J_ad and I_pow values inside
+# _AEZState._buf.
+_I_OFFSET = 0
+_J_OFFSET = 2
+_L_OFFSET = 5
+_J_AD_OFFSET = 13
+_I_POW_OFFSET = 16
+_KEY_BLOCKS = 21
+
 
 class _AEZState:
     def __init__(self) -> None:
-        self.I = [_mk_block(), _mk_block()]
-        self.J = [_mk_block(), _mk_block(), _mk_block()]
-        self.L = [_mk_block() for _ in range(8)]
+        # I[0..1], J[0..2], L[0..7], J_ad[0..2] and I_pow[0..4] live in one
+        # contiguous buffer; the lists below hold 16-byte memoryview rows
+        # into it.
+        self._buf = bytearray(_KEY_BLOCKS * BLOCK_SIZE)
+        view = memoryview(self._buf)
+        rows = [view[k * BLOCK_SIZE:(k + 1) * BLOCK_SIZE] for k in range(_KEY_BLOCKS)]
+        self.I = rows[_I_OFFSET:_J_OFFSET]
+        self.J = rows[_J_OFFSET:_L_OFFSET]
+        self.L = rows[_L_OFFSET:_J_AD_OFFSET]
+        self.J_ad = rows[_J_AD_OFFSET:_I_POW_OFFSET]
+        self.I_pow = rows[_I_POW_OFFSET:]
         self.aes: _AESRound | None = None
+        # Scratch blocks reused across calls, named after the method that
+        # owns them so that no two live temporaries alias each other.
+        self._hash_buf = _mk_block()
+        self._hash_I = _mk_block()
+        self._hash_J = _mk_block()
+        self._prf_buf = _mk_block()
+        self._prf_ctr = _mk_block()
+        self._tiny_buf = bytearray(2 * BLOCK_SIZE)
+        self._tiny_view = memoryview(self._tiny_buf)
+        self._tiny_L = _mk_block()
+        self._tiny_R = _mk_block()
+        self._tiny_tmp = _mk_block()
+        self._tiny_whitening = _mk_block()
 
     def reset(self) -> None:
-        for buf in self.I + self.J + self.L:
-            for i in range(len(buf)):
-                buf[i] = 0
+        self._buf[:] = bytes(len(self._buf))
         if self.aes:
             self.aes.reset()
 
     def init(self, key: bytes) -> None:
-        extracted = _extract_key(key)
+        self.load_extracted_key(_extract_key(key))
+
+    def load_extracted_key(self, extracted: bytes) -> None:
+        """Derive the AEZ subkeys from an already-extracted 48-byte key."""
         self.I[0][:] = extracted[0:16]
         _mult_block(2, self.I[0], self.I[1])
         self.J[0][:] = extracted[16:32]
@@ -402,85 +523,107 @@ class _AEZState:
         _xor_bytes1x16(self.L[4], self.L[1], self.L[5])
         _mult_block(2, self.L[3], self.L[6])
         _xor_bytes1x16(self.L[6], self.L[1], self.L[7])
-        self.aes = _AESRound(extracted)
+        # aez_hash whitens AD piece k with (5 + k) * J[0]; since J[1] and J[2]
+        # already hold 2 * J[0] and 4 * J[0], the first few are single XORs.
+        _xor_bytes1x16(self.J[2], self.J[0], self.J_ad[0])
+        _xor_bytes1x16(self.J[2], self.J[1], self.J_ad[1])
+        _xor_bytes1x16(self.J_ad[1], self.J[0], self.J_ad[2])
+        # I_pow[k] is I[1] doubled k times: the offset used for the k-th run
+        # of eight blocks in aez_hash and the core passes.
+        self.I_pow[0][:] = self.I[1]
+        for k in range(1, len(self.I_pow)):
+            self.I_pow[k][:] = self.I_pow[k - 1]
+            _double_block(self.I_pow[k])
+        if self.aes is None:
+            self.aes = _AESRound(extracted)
+        else:
+            self.aes.load_key(extracted)
+
+    def _I_power(self, k: int, dst: bytearray) -> Sequence[int]:
+        """Return I[1] doubled ``k`` times, computing into ``dst`` past the cache."""
+        if k < len(self.I_pow):
+            return self.I_pow[k]
+        dst[:] = self.I_pow[-1]
+        for _ in range(k - len(self.I_pow) + 1):
+            _double_block(dst)
+        return dst
+
+    def _I_schedule(self, count: int) -> list[int]:
+        """Return I[1] doubled 0..count-1 times as 128-bit big-endian integers."""
+        schedule = [int.from_bytes(p, "big") for p in self.I_pow[:count]]
+        while len(schedule) < count:
+            n = schedule[-1]
+            schedule.append(((n << 1) & _BLOCK_MASK) ^ (0x87 if n >> 127 else 0))
+        return schedule
 
     def aez_hash(self, nonce: bytes | None, ad: Iterable[bytes], tau: int) -> bytearray:
         assert self.aes is not None
-        buf = _mk_block()
+        buf = self._hash_buf
         sum_block = _mk_block()
-        I_tmp = _mk_block()
-        J_tmp = _mk_block()
+        I_tmp = self._hash_I
+        J_tmp = self._hash_J
+        buf[:12] = _ZERO16[:12]
         buf[12:16] = _uint32(tau).to_bytes(4, "big")
         _xor_bytes1x16(self.J[0], self.J[1], J_tmp)
         self.aes.AES4(J_tmp, self.I[1], self.L[1], buf, sum_block)
 
         empty_nonce = not nonce
         n_bytes = len(nonce) if nonce else 0
-        I_tmp[:] = self.I[1]
         offset = 0
         i = 1
         while n_bytes >= BLOCK_SIZE:
             block = nonce[offset:offset + BLOCK_SIZE]
-            tmp = _mk_block()
-            tmp[:BLOCK_SIZE] = block
-            self.aes.AES4(self.J[2], I_tmp, self.L[i % 8], tmp, buf)
-            _xor_bytes1x16(sum_block, buf, sum_block)
+            I_cur = self._I_power((i - 1) >> 3, I_tmp)
+            self.aes.AES4_xor(self.J[2], I_cur, self.L[i % 8], block, sum_block)
             offset += BLOCK_SIZE
             n_bytes -= BLOCK_SIZE
-            if i % 8 == 0:
-                _double_block(I_tmp)
             i += 1
         if n_bytes > 0 or empty_nonce:
-            buf[:] = b"\x00" * BLOCK_SIZE
+            buf[:] = _ZERO16
             if not empty_nonce and nonce is not None:
                 buf[:n_bytes] = nonce[offset:offset + n_bytes]
             buf[n_bytes] = 0x80
-            self.aes.AES4(self.J[2], self.I[0], self.L[0], buf, buf)
-            _xor_bytes1x16(sum_block, buf, sum_block)
+            self.aes.AES4_xor(self.J[2], self.I[0], self.L[0], buf, sum_block)
 
         for k, piece in enumerate(ad):
             empty_piece = not piece
             bytes_left = len(piece) if piece else 0
-            I_tmp[:] = self.I[1]
-            J_tmp2 = _mk_block()
-            _mult_block(5 + k, self.J[0], J_tmp2)
+            if k < len(self.J_ad):
+                J_tmp2 = self.J_ad[k]
+            else:
+                J_tmp2 = _mk_block()
+                _mult_block(5 + k, self.J[0], J_tmp2)
             offset = 0
             i = 1
             while bytes_left >= BLOCK_SIZE:
-                tmp_in = piece[offset:offset + BLOCK_SIZE]
-                tmp = _mk_block()
-                tmp[:BLOCK_SIZE] = tmp_in
-                self.aes.AES4(J_tmp2, I_tmp, self.L[i % 8], tmp, buf)
-                _xor_bytes1x16(sum_block, buf, sum_block)
+                block = piece[offset:offset + BLOCK_SIZE]
+                I_cur = self._I_power((i - 1) >> 3, I_tmp)
+                self.aes.AES4_xor(J_tmp2, I_cur, self.L[i % 8], block, sum_block)
                 offset += BLOCK_SIZE
                 bytes_left -= BLOCK_SIZE
-                if i % 8 == 0:
-                    _double_block(I_tmp)
                 i += 1
             if bytes_left > 0 or empty_piece:
-                buf[:] = b"\x00" * BLOCK_SIZE
+                buf[:] = _ZERO16
                 if not empty_piece and piece:
                     buf[:bytes_left] = piece[offset:offset + bytes_left]
                 buf[bytes_left] = 0x80
-                self.aes.AES4(J_tmp2, self.I[0], self.L[0], buf, buf)
-                _xor_bytes1x16(sum_block, buf, sum_block)
+                self.aes.AES4_xor(J_tmp2, self.I[0], self.L[0], buf, sum_block)
 
         return sum_block
 
     def aez_prf(self, delta: Sequence[int], tau: int, dst: bytearray) -> None:
         assert self.aes is not None
-        buf = _mk_block()
-        ctr = _mk_block()
+        buf = self._prf_buf
+        ctr = self._prf_ctr
+        ctr[:] = _ZERO16
         off = 0
         remaining = tau
         while remaining >= BLOCK_SIZE:
             _xor_bytes1x16(delta, ctr, buf)
             self.aes.AES10(self.L[3], buf, buf)
             dst[off:off + BLOCK_SIZE] = buf
-            for idx in range(15, -1, -1):
-                ctr[idx] = (ctr[idx] + 1) & 0xFF
-                if ctr[idx] != 0:
-                    break
+            # Big-endian 128-bit increment with wraparound in one bignum add.
+            ctr[:] = ((int.from_bytes(ctr, "big") + 1) & _BLOCK_MASK).to_bytes(BLOCK_SIZE, "big")
             off += BLOCK_SIZE
             remaining -= BLOCK_SIZE
         if remaining > 0:
@@ -507,11 +650,13 @@ class _AEZState:
     def aez_tiny(self, delta: Sequence[int], data: bytes, direction: int, dst: bytearray) -> None:
         assert self.aes is not None
         in_bytes = len(data)
-        buf = bytearray(2 * BLOCK_SIZE)
-        buf_view = memoryview(buf)
-        L = _mk_block()
-        R = _mk_block()
-        tmp = _mk_block()
+        buf = self._tiny_buf
+        buf_view = self._tiny_view
+        L = self._tiny_L
+        R = self._tiny_R
+        tmp = self._tiny_tmp
+        L[:] = _ZERO16
+        R[:] = _ZERO16
         mask = 0x00
         pad = 0x80
         idx_param = 7
@@ -530,16 +675,16 @@ class _AEZState:
         L[:left_len] = data[:left_len]
         R[:left_len] = data[right_start:right_start + left_len]
         if in_bytes & 1:
+            # Shift R[:half + 1] left by one nibble as a single integer.
             half = in_bytes // 2
-            for k in range(half):
-                R[k] = ((R[k] << 4) | (R[k + 1] >> 4)) & 0xFF
-            R[half] = (R[half] << 4) & 0xFF
+            n = int.from_bytes(R[:half + 1], "big") << 4
+            R[:half + 1] = (n & ((1 << (8 * (half + 1))) - 1)).to_bytes(half + 1, "big")
             pad = 0x08
             mask = 0xF0
 
         if direction != 0:
             if in_bytes < BLOCK_SIZE:
-                buf[:BLOCK_SIZE] = b"\x00" * BLOCK_SIZE
+                buf[:BLOCK_SIZE] = _ZERO16
                 buf[:in_bytes] = data
                 buf[0] |= 0x80
                 _xor_bytes1x16(delta, buf_view[:BLOCK_SIZE], buf_view[:BLOCK_SIZE])
@@ -551,36 +696,45 @@ class _AEZState:
             j = 0
             step = 1
 
+        # Every Feistel round whitens its input with the same delta ^ I[1] ^
+        # L[idx_param] before the AES4 rounds, so fold that key once up front
+        # and run the rounds in place on the first half of ``buf``.
+        aes = self.aes
+        block = buf_view[:BLOCK_SIZE]
+        whitening = self._tiny_whitening
+        _xor_bytes4x16(delta, ZERO_BLOCK, self.I[1], self.L[idx_param], whitening)
+        mid_index = in_bytes // 2
         for _ in range(rounds // 2):
-            buf[:BLOCK_SIZE] = b"\x00" * BLOCK_SIZE
+            buf[:BLOCK_SIZE] = _ZERO16
             buf[:left_len] = R[:left_len]
-            mid_index = in_bytes // 2
             buf[mid_index] = (buf[mid_index] & mask) | pad
-            _xor_bytes1x16(buf_view[:BLOCK_SIZE], delta, buf_view[:BLOCK_SIZE])
+            _xor_bytes1x16(block, whitening, block)
             buf[15] ^= j & 0xFF
-            self.aes.AES4(ZERO_BLOCK, self.I[1], self.L[idx_param], buf_view[:BLOCK_SIZE], tmp)
-            _xor_bytes1x16(L, tmp, L)
+            aes.rounds4(block)
+            _xor_bytes1x16(L, block, L)
 
-            buf[:BLOCK_SIZE] = b"\x00" * BLOCK_SIZE
+            buf[:BLOCK_SIZE] = _ZERO16
             buf[:left_len] = L[:left_len]
             buf[mid_index] = (buf[mid_index] & mask) | pad
-            _xor_bytes1x16(buf_view[:BLOCK_SIZE], delta, buf_view[:BLOCK_SIZE])
+            _xor_bytes1x16(block, whitening, block)
             buf[15] ^= (j + step) & 0xFF
-            self.aes.AES4(ZERO_BLOCK, self.I[1], self.L[idx_param], buf_view[:BLOCK_SIZE], tmp)
-            _xor_bytes1x16(R, tmp, R)
+            aes.rounds4(block)
+            _xor_bytes1x16(R, block, R)
             j += step * 2
 
         half = in_bytes // 2
         buf[:half] = R[:half]
         buf[half:half + left_len] = L[:left_len]
         if in_bytes & 1:
-            for k in range(in_bytes - 1, half, -1):
-                buf[k] = ((buf[k] >> 4) | (buf[k - 1] << 4)) & 0xFF
+            # Undo the nibble shift on buf[half:in_bytes]; the first byte of
+            # that range is then rebuilt from L and R.
+            n = int.from_bytes(buf[half:in_bytes], "big") >> 4
+            buf[half:in_bytes] = n.to_bytes(in_bytes - half, "big")
             buf[half] = ((L[0] >> 4) & 0x0F) | (R[half] & 0xF0)
 
         dst[:in_bytes] = buf[:in_bytes]
         if in_bytes < BLOCK_SIZE and direction == 0:
-            buf[in_bytes:BLOCK_SIZE] = b"\x00" * (BLOCK_SIZE - in_bytes)
+            buf[in_bytes:BLOCK_SIZE] = _ZERO16[in_bytes:]
             buf[0] |= 0x80
             _xor_bytes1x16(delta, buf_view[:BLOCK_SIZE], buf_view[:BLOCK_SIZE])
             self.aes.AES4(ZERO_BLOCK, self.I[1], self.L[3], buf_view[:BLOCK_SIZE], tmp)
@@ -588,193 +742,168 @@ class _AEZState:
 
     def aez_core(self, delta: Sequence[int], data: bytes, direction: int, dst: bytearray) -> None:
         assert self.aes is not None
+        # The X, Y and S checksums and every block they touch are carried as
+        # 128-bit big-endian integers; bytes are only produced where a
+        # result lands in a destination buffer.
+        aes4, aes10 = self.aes.AES4_int, self.aes.AES10_int
+        I1 = int.from_bytes(self.I[1], "big")
+        L = [int.from_bytes(l_vec, "big") for l_vec in self.L]
+        delta_int = int.from_bytes(delta, "big")
         in_bytes = len(data)
         frag_bytes = in_bytes % 32
         initial_bytes = in_bytes - frag_bytes - 32
-        tmp = _mk_block()
-        X = _mk_block()
-        Y = _mk_block()
-        S = _mk_block()
+        padded = _mk_block()
         input_bytes = bytearray(data)
 
-        if in_bytes >= 64:
-            self.aez_core_pass1(input_bytes, dst, X)
+        X = self.aez_core_pass1(input_bytes, dst) if in_bytes >= 64 else 0
 
         tail = input_bytes[initial_bytes:]
         if frag_bytes >= BLOCK_SIZE:
-            buf = _mk_block()
-            buf[:BLOCK_SIZE] = tail[BLOCK_SIZE:BLOCK_SIZE * 2]
-            self.aes.AES4(ZERO_BLOCK, self.I[1], self.L[4], buf, tmp)
-            _xor_bytes1x16(X, tmp, X)
-            padded = _mk_block()
+            X ^= aes4(0, I1, L[4], int.from_bytes(tail[BLOCK_SIZE:BLOCK_SIZE * 2], "big"))
             _one_zero_pad(tail[BLOCK_SIZE:], frag_bytes - BLOCK_SIZE, padded)
-            self.aes.AES4(ZERO_BLOCK, self.I[1], self.L[5], padded, tmp)
-            _xor_bytes1x16(X, tmp, X)
+            X ^= aes4(0, I1, L[5], int.from_bytes(padded, "big"))
         elif frag_bytes > 0:
-            padded = _mk_block()
             _one_zero_pad(tail, frag_bytes, padded)
-            self.aes.AES4(ZERO_BLOCK, self.I[1], self.L[4], padded, tmp)
-            _xor_bytes1x16(X, tmp, X)
+            X ^= aes4(0, I1, L[4], int.from_bytes(padded, "big"))
 
         dst_tail = dst[in_bytes - 32:in_bytes]
         input_tail = input_bytes[in_bytes - 32:in_bytes]
-        block1 = _mk_block()
-        block1[:BLOCK_SIZE] = input_tail[:BLOCK_SIZE]
-        block2 = _mk_block()
-        block2[:BLOCK_SIZE] = input_tail[BLOCK_SIZE:BLOCK_SIZE * 2]
-        self.aes.AES4(ZERO_BLOCK, self.I[1], self.L[(1 + direction) % 8], block2, tmp)
-        first_dst = _mk_block()
-        _xor_bytes4x16(X, block1, delta, tmp, first_dst)
-        dst_tail[:BLOCK_SIZE] = first_dst
-        tmp2 = _mk_block()
-        self.aes.AES10(self.L[(1 + direction) % 8], first_dst, tmp2)
-        second_dst = bytearray(block2)
-        _xor_bytes1x16(second_dst, tmp2, second_dst)
-        dst_tail[BLOCK_SIZE:BLOCK_SIZE * 2] = second_dst
-        _xor_bytes1x16(first_dst, second_dst, S)
-
-        if in_bytes >= 64:
-            self.aez_core_pass2(input_bytes, dst, Y, S)
+        block1 = int.from_bytes(input_tail[:BLOCK_SIZE], "big")
+        block2 = int.from_bytes(input_tail[BLOCK_SIZE:BLOCK_SIZE * 2], "big")
+        L_dir = L[(1 + direction) % 8]
+        first_dst = X ^ block1 ^ delta_int ^ aes4(0, I1, L_dir, block2)
+        dst_tail[:BLOCK_SIZE] = first_dst.to_bytes(BLOCK_SIZE, "big")
+        second_dst = block2 ^ aes10(L_dir, first_dst)
+        dst_tail[BLOCK_SIZE:BLOCK_SIZE * 2] = second_dst.to_bytes(BLOCK_SIZE, "big")
+        S = first_dst ^ second_dst
+
+        Y = self.aez_core_pass2(input_bytes, dst, S) if in_bytes >= 64 else 0
 
         dst_fragment = dst[initial_bytes:]
         input_fragment = input_bytes[initial_bytes:]
         if frag_bytes >= BLOCK_SIZE:
-            tmp_block = _mk_block()
-            self.aes.AES10(self.L[4], S, tmp_block)
-            block = bytearray(input_fragment[:BLOCK_SIZE])
-            _xor_bytes1x16(block, tmp_block, block)
-            dst_fragment[:BLOCK_SIZE] = block
-            self.aes.AES4(ZERO_BLOCK, self.I[1], self.L[4], block, tmp)
-            _xor_bytes1x16(Y, tmp, Y)
+            block = int.from_bytes(input_fragment[:BLOCK_SIZE], "big") ^ aes10(L[4], S)
+            dst_fragment[:BLOCK_SIZE] = block.to_bytes(BLOCK_SIZE, "big")
+            Y ^= aes4(0, I1, L[4], block)
 
             remaining = frag_bytes - BLOCK_SIZE
-            tmp_block = _mk_block()
-            self.aes.AES10(self.L[5], S, tmp_block)
-            buf = bytearray(tmp_block)
-            fragment = bytearray(input_fragment[BLOCK_SIZE:BLOCK_SIZE + remaining])
-            for idx in range(remaining):
-                buf[idx] ^= fragment[idx]
+            buf = bytearray(aes10(L[5], S).to_bytes(BLOCK_SIZE, "big"))
+            fragment = input_fragment[BLOCK_SIZE:BLOCK_SIZE + remaining]
+            _xor_bytes(buf, fragment, memoryview(buf)[:remaining])
             dst_fragment[BLOCK_SIZE:BLOCK_SIZE + remaining] = buf[:remaining]
-            buf[:] = b"\x00" * BLOCK_SIZE
-            buf[:remaining] = dst_fragment[BLOCK_SIZE:BLOCK_SIZE + remaining]
-            buf[remaining] = 0x80
-            self.aes.AES4(ZERO_BLOCK, self.I[1], self.L[5], buf, tmp)
-            _xor_bytes1x16(Y, tmp, Y)
-            dst_fragment = dst_fragment[BLOCK_SIZE + remaining:]
-            input_fragment = input_fragment[BLOCK_SIZE + remaining:]
+            _one_zero_pad(dst_fragment[BLOCK_SIZE:], remaining, padded)
+            Y ^= aes4(0, I1, L[5], int.from_bytes(padded, "big"))
         elif frag_bytes > 0:
-            tmp_block = _mk_block()
-            self.aes.AES10(self.L[4], S, tmp_block)
-            buf = bytearray(tmp_block)
-            fragment = bytearray(input_fragment[:frag_bytes])
-            for idx in range(frag_bytes):
-                buf[idx] ^= fragment[idx]
+            buf = bytearray(aes10(L[4], S).to_bytes(BLOCK_SIZE, "big"))
+            fragment = input_fragment[:frag_bytes]
+            _xor_bytes(buf, fragment, memoryview(buf)[:frag_bytes])
             dst_fragment[:frag_bytes] = buf[:frag_bytes]
-            buf[:] = b"\x00" * BLOCK_SIZE
-            buf[:frag_bytes] = dst_fragment[:frag_bytes]
-            buf[frag_bytes] = 0x80
-            self.aes.AES4(ZERO_BLOCK, self.I[1], self.L[4], buf, tmp)
-            _xor_bytes1x16(Y, tmp, Y)
-            dst_fragment = dst_fragment[frag_bytes:]
-            input_fragment = input_fragment[frag_bytes:]
+            _one_zero_pad(dst_fragment, frag_bytes, padded)
+            Y ^= aes4(0, I1, L[4], int.from_bytes(padded, "big"))
 
         dst_tail = dst[in_bytes - 32:in_bytes]
-        second_half = bytearray(dst_tail[BLOCK_SIZE:BLOCK_SIZE * 2])
-        tmp_block = _mk_block()
-        self.aes.AES10(self.L[(2 - direction) % 8], second_half, tmp_block)
-        first_half = bytearray(dst_tail[:BLOCK_SIZE])
-        _xor_bytes1x16(first_half, tmp_block, first_half)
-        dst_tail[:BLOCK_SIZE] = first_half
-        self.aes.AES4(ZERO_BLOCK, self.I[1], self.L[(2 - direction) % 8], first_half, tmp)
-        combined = _mk_block()
-        _xor_bytes4x16(tmp, dst_tail[BLOCK_SIZE:BLOCK_SIZE * 2], delta, Y, combined)
-        dst_tail[BLOCK_SIZE:BLOCK_SIZE * 2] = combined
-        tmp_copy = bytearray(dst_tail[:BLOCK_SIZE])
-        dst_tail[:BLOCK_SIZE] = combined
-        dst_tail[BLOCK_SIZE:BLOCK_SIZE * 2] = tmp_copy
-
-    def aez_core_pass1(self, input_bytes: bytearray, output: bytearray, X: bytearray) -> None:
+        L_dir = L[(2 - direction) % 8]
+        second_half = int.from_bytes(dst_tail[BLOCK_SIZE:BLOCK_SIZE * 2], "big")
+        first_half = int.from_bytes(dst_tail[:BLOCK_SIZE], "big") ^ aes10(L_dir, second_half)
+        combined = aes4(0, I1, L_dir, first_half) ^ second_half ^ delta_int ^ Y
+        dst_tail[:BLOCK_SIZE] = combined.to_bytes(BLOCK_SIZE, "big")
+        dst_tail[BLOCK_SIZE:BLOCK_SIZE * 2] = first_half.to_bytes(BLOCK_SIZE, "big")
+
+    def aez_core_pass1(self, input_bytes: bytearray, output: bytearray) -> int:
         assert self.aes is not None
-        tmp = _mk_block()
-        I_tmp = _mk_block()
-        I_tmp[:] = self.I[1]
+        # The whole pass runs in int space.  The input is first split into
+        # two column lists of 128-bit big-endian integers (first and second
+        # half of each 32-byte pair); each stage below is then a single
+        # comprehension over those columns, and the output is written back
+        # in one slice assignment.  The second halves fold into the returned
+        # X checksum.
+        rounds4 = self.aes.rounds4_int
+        n_pairs = (len(input_bytes) - 32) // 32
+        # Pair i uses I[1] doubled i // 8 times; fetch every power the pass
+        # will need up front.
+        I_sched = self._I_schedule(n_pairs // 8 + 1)
+        J0 = int.from_bytes(self.J[0], "big")
+        L = [int.from_bytes(l_vec, "big") for l_vec in self.L]
+        I0_L0 = int.from_bytes(self.I[0], "big") ^ L[0]
+        inp = memoryview(input_bytes)
+        firsts = [int.from_bytes(inp[32 * k:32 * k + 16], "big") for k in range(n_pairs)]
+        seconds = [int.from_bytes(inp[32 * k + 16:32 * k + 32], "big") for k in range(n_pairs)]
+        # The first AES4 of every pair depends only on the input, so run them
+        # all as one batch; only the second AES4 has to wait for first_out.
+        whitened = [J0 ^ I_sched[i >> 3] ^ L[i % 8] ^ b for i, b in enumerate(seconds, 1)]
+        first_outs = [a ^ e for a, e in zip(firsts, map(rounds4, whitened))]
+        second_outs = [b ^ rounds4(I0_L0 ^ f) for f, b in zip(first_outs, seconds)]
+        output[:32 * n_pairs] = b"".join(
+            f.to_bytes(BLOCK_SIZE, "big") + b.to_bytes(BLOCK_SIZE, "big")
+            for f, b in zip(first_outs, second_outs)
+        )
+        return reduce(xor, second_outs, 0)
+
+    def aez_core_pass2(self, input_bytes: bytearray, output: bytearray, S: int) -> int:
+        assert self.aes is not None
+        # Same int-space layout as pass1: the AES4 results feed the XORs
+        # directly, so no temporary block is materialised.
+        aes4 = self.aes.AES4_int
+        I_sched = self._I_schedule((len(input_bytes) - 32) // 32 // 8 + 1)
+        J0 = int.from_bytes(self.J[0], "big")
+        J1 = int.from_bytes(self.J[1], "big")
+        L = [int.from_bytes(l_vec, "big") for l_vec in self.L]
+        I0 = int.from_bytes(self.I[0], "big")
+        out = memoryview(output)
+        y_acc = 0
         offset = 0
         remaining = len(input_bytes)
         i = 1
         while remaining >= 64:
-            block1 = bytearray(input_bytes[offset + BLOCK_SIZE:offset + BLOCK_SIZE * 2])
-            self.aes.AES4(self.J[0], I_tmp, self.L[i % 8], block1, tmp)
-            first_out = bytearray(input_bytes[offset:offset + BLOCK_SIZE])
-            _xor_bytes1x16(first_out, tmp, first_out)
-            output[offset:offset + BLOCK_SIZE] = first_out
-
-            self.aes.AES4(ZERO_BLOCK, self.I[0], self.L[0], first_out, tmp)
-            second_out = bytearray(input_bytes[offset + BLOCK_SIZE:offset + BLOCK_SIZE * 2])
-            _xor_bytes1x16(second_out, tmp, second_out)
-            output[offset + BLOCK_SIZE:offset + BLOCK_SIZE * 2] = second_out
-            _xor_bytes1x16(second_out, X, X)
+            mid = offset + BLOCK_SIZE
+            end = mid + BLOCK_SIZE
+            I_cur = I_sched[i >> 3]
+            L_cur = L[i % 8]
+            t = aes4(J1, I_cur, L_cur, S)
+            first_out = int.from_bytes(out[offset:mid], "big") ^ t
+            second_out = int.from_bytes(out[mid:end], "big") ^ t
+            y_acc ^= first_out
+
+            first_out ^= aes4(0, I0, L[0], second_out)
+            second_out ^= aes4(J0, I_cur, L_cur, first_out)
+
+            # The two halves swap places on output.
+            out[offset:mid] = second_out.to_bytes(BLOCK_SIZE, "big")
+            out[mid:end] = first_out.to_bytes(BLOCK_SIZE, "big")
 
             offset += 32
             remaining -= 32
             i += 1
-            if i % 8 == 0:
-                _double_block(I_tmp)
+        return y_acc
 
-    def aez_core_pass2(self, input_bytes: bytearray, output: bytearray, Y: bytearray, S: bytearray) -> None:
-        assert self.aes is not None
-        tmp = _mk_block()
-        I_tmp = _mk_block()
-        I_tmp[:] = self.I[1]
-        offset = 0
-        remaining = len(input_bytes)
-        i = 1
-        while remaining >= 64:
-            first_out = bytearray(output[offset:offset + BLOCK_SIZE])
-            second_out = bytearray(output[offset + BLOCK_SIZE:offset + BLOCK_SIZE * 2])
-            self.aes.AES4(self.J[1], I_tmp, self.L[i % 8], S, tmp)
-            _xor_bytes1x16(first_out, tmp, first_out)
-            _xor_bytes1x16(second_out, tmp, second_out)
-            _xor_bytes1x16(first_out, Y, Y)
-
-            self.aes.AES4(ZERO_BLOCK, self.I[0], self.L[0], second_out, tmp)
-            _xor_bytes1x16(first_out, tmp, first_out)
+_thread_state = threading.local()
 
-            self.aes.AES4(self.J[0], I_tmp, self.L[i % 8], first_out, tmp)
-            _xor_bytes1x16(second_out, tmp, second_out)
 
-            temp = bytearray(first_out)
-            first_out[:] = second_out
-            second_out[:] = temp
+def _get_state() -> _AEZState:
+    """Return this thread's reusable AEZ state.
 
-            output[offset:offset + BLOCK_SIZE] = first_out
-            output[offset + BLOCK_SIZE:offset + BLOCK_SIZE * 2] = second_out
-
-            offset += 32
-            remaining -= 32
-            i += 1
-            if i % 8 == 0:
-                _double_block(I_tmp)
+    init() overwrites every key-derived block (L[0] is always zero), so one
+    state object can be re-keyed for each candidate instead of rebuilt.
+    """
+    state = getattr(_thread_state, "aez", None)
+    if state is None:
+        state = _thread_state.aez = _AEZState()
+    return state
 
 
 def _aez_decrypt(key: bytes, ad_list: Iterable[bytes], tau: int, ciphertext: bytes) -> bytes | None:
-    state = _AEZState()
-    state.reset()
+    state = _get_state()
     state.init(key)
     delta = state.aez_hash(None, list(ad_list), tau * 8)
     x = bytearray(len(ciphertext))
     if len(ciphertext) == tau:
         state.aez_prf(delta, tau, x)
-        mismatch = 0
-        for i in range(tau):
-            mismatch |= x[i] ^ ciphertext[i]
-        if mismatch != 0:
+        if not hmac.compare_digest(x, ciphertext):
             return None
         return bytes()
     state.decipher(delta, ciphertext, x)
-    mismatch = 0
-    for i in range(tau):
-        mismatch |= x[len(ciphertext) - tau + i]
-    if mismatch != 0:
+    # The authenticator is tau zero bytes appended to the plaintext.
+    if not hmac.compare_digest(x[len(ciphertext) - tau:], bytes(tau)):
         return None
     return bytes(x[: len(ciphertext) - tau])
 
@@ -782,46 +911,42 @@ def _aez_decrypt(key: bytes, ad_list: Iterable[bytes], tau: int, ciphertext: byt
 def mnemonic_to_bytes(words: Sequence[str], word_to_index: dict[str, int]) -> bytes:
     if len(words) != 24:
         raise InvalidMnemonicError("aezeed mnemonics must have 24 words")
+    # Fold all 24 eleven-bit indices into one integer and serialise it once.
     bits = 0
-    bit_len = 0
-    out = bytearray(EncipheredCipherSeedSize)
-    pos = 0
     for word in words:
         try:
             idx = word_to_index[word]
         except KeyError as exc:
             raise InvalidMnemonicError(f"unknown word: {word}") from exc
         bits = (bits << BitsPerWord) | idx
-        bit_len += BitsPerWord
-        while bit_len >= 8:
-            bit_len -= 8
-            out[pos] = (bits >> bit_len) & 0xFF
-            bits &= (1 << bit_len) - 1 if bit_len else 0
-            pos += 1
-    return bytes(out)
+    shift = len(words) * BitsPerWord - EncipheredCipherSeedSize * 8
+    return (bits >> shift).to_bytes(EncipheredCipherSeedSize, "big")
+
+
+def _mnemonic_first_byte(words: Sequence[str], word_to_index: dict[str, int]) -> int:
+    """Return the version byte, i.e. the top eight bits of the first word."""
+    return (word_to_index[words[0]] >> (BitsPerWord - 8)) & 0xFF
 
 
 def validate_mnemonic(words: Sequence[str], word_to_index: dict[str, int]) -> bool:
+    # Reject a wrong version from the first word alone before packing all 24.
+    try:
+        if _mnemonic_first_byte(words, word_to_index) != CipherSeedVersion:
+            return False
+    except (IndexError, KeyError):
+        return False
     try:
         cipher_bytes = mnemonic_to_bytes(words, word_to_index)
     except InvalidMnemonicError:
         return False
-    if cipher_bytes[0] != CipherSeedVersion:
-        return False
     expected = int.from_bytes(cipher_bytes[-4:], "big")
     computed = _crc32c(cipher_bytes[: EncipheredCipherSeedSize - 4])
     return expected == computed
 
 
-def _encode_ad(version: int, salt: bytes) -> bytes:
-    return bytes([version]) + salt
-
-
-def decode_mnemonic(
-    words: Sequence[str],
-    passphrase: str,
-    word_to_index: dict[str, int],
-) -> DecipheredCipherSeed:
+def _split_cipher_bytes(
+    words: Sequence[str], word_to_index: dict[str, int]
+) -> Tuple[bytes, bytes, bytes]:
     cipher_bytes = mnemonic_to_bytes(words, word_to_index)
     version = cipher_bytes[0]
     if version != CipherSeedVersion:
@@ -832,17 +957,116 @@ def decode_mnemonic(
         raise InvalidMnemonicError("checksum mismatch")
     salt = cipher_bytes[EncipheredCipherSeedSize - 4 - SaltSize : EncipheredCipherSeedSize - 4]
     ciphertext = cipher_bytes[1 : EncipheredCipherSeedSize - 4 - SaltSize]
+    # The AEZ associated data is the version byte followed by the salt; it is
+    # fixed per mnemonic, so build it here once for every candidate.
+    ad = cipher_bytes[:1] + salt
+    return salt, ad, ciphertext
+
+
+@lru_cache(maxsize=4096)
+def _scrypt_key(pass_bytes: bytes, salt: bytes) -> bytes:
+    """Derive the AEZ key; cached because recovery repeats (passphrase, salt) pairs."""
+    return hashlib.scrypt(pass_bytes, salt=salt, n=32768, r=8, p=1, dklen=32, maxmem=2_000_000_000)
+
+
+def _passphrase_bytes(passphrase: str | bytes | None) -> bytes:
     # LND always prefixes the default passphrase to user-supplied strings before
     # running scrypt.  Append the provided passphrase to the base constant so
-    # recovery works for mnemonics created with custom passphrases.
-    pass_bytes = (DEFAULT_PASSPHRASE + (passphrase or "")).encode("utf-8")
-    key = hashlib.scrypt(pass_bytes, salt=salt, n=32768, r=8, p=1, dklen=32, maxmem=2_000_000_000)
-    ad = _encode_ad(version, salt)
+    # recovery works for mnemonics created with custom passphrases.  Bytes
+    # (e.g. read straight from a password list) are taken as already encoded.
+    if not passphrase:
+        return _DEFAULT_PASS_BYTES
+    if isinstance(passphrase, bytes):
+        return _DEFAULT_PASS_BYTES + passphrase
+    return _DEFAULT_PASS_BYTES + passphrase.encode("utf-8")
+
+
+def _decrypt_cipher_seed(
+    salt: bytes, ad: bytes, ciphertext: bytes, passphrase: str | bytes
+) -> DecipheredCipherSeed | None:
+    pass_bytes = _passphrase_bytes(passphrase)
+    key = _scrypt_key(pass_bytes, salt)
     plaintext = _aez_decrypt(key, [ad], CipherTextExpansion, ciphertext)
     if plaintext is None or len(plaintext) != DecipheredCipherSeedSize:
-        raise InvalidPassphraseError("invalid passphrase")
+        return None
     internal_version = plaintext[0]
     birthday = int.from_bytes(plaintext[1:3], "big")
     entropy = plaintext[3:]
     return DecipheredCipherSeed(entropy=bytes(entropy), salt=bytes(salt), internal_version=internal_version, birthday=birthday)
 
+
+def decode_mnemonic(
+    words: Sequence[str],
+    passphrase: str | bytes,
+    word_to_index: dict[str, int],
+) -> DecipheredCipherSeed:
+    salt, ad, ciphertext = _split_cipher_bytes(words, word_to_index)
+    seed = _decrypt_cipher_seed(salt, ad, ciphertext, passphrase)
+    if seed is None:
+        raise InvalidPassphraseError("invalid passphrase")
+    return seed
+
+
+def try_passphrases(
+    words: Sequence[str],
+    passphrases: Iterable[str],
+    word_to_index: dict[str, int],
+) -> Iterator[Tuple[str, DecipheredCipherSeed]]:
+    """Yield ``(passphrase, seed)`` for every candidate that decrypts ``words``.
+
+    The mnemonic is decoded, checksummed and encoded as associated data once
+    rather than once per candidate.  Everything else depends on the
+    passphrase: every AES call in the AEZ hash is keyed by the scrypt output,
+    so there is no seed-only partial sum left to cache.
+    """
+    salt, ad, ciphertext = _split_cipher_bytes(words, word_to_index)
+    for passphrase in passphrases:
+        seed = _decrypt_cipher_seed(salt, ad, ciphertext, passphrase)
+        if seed is not None:
+            yield passphrase, seed
+
+
+def _try_passphrase_chunk(
+    salt: bytes, ad: bytes, ciphertext: bytes, passphrases: Sequence[str]
+) -> Tuple[str, DecipheredCipherSeed] | None:
+    for passphrase in passphrases:
+        seed = _decrypt_cipher_seed(salt, ad, ciphertext, passphrase)
+        if seed is not None:
+            return passphrase, seed
+    return None
+
+
+def decode_mnemonic_batch(
+    words: Sequence[str],
+    passphrases: Iterable[str],
+    word_to_index: dict[str, int],
+    max_workers: int | None = None,
+    chunk_size: int = 16,
+) -> Tuple[str, DecipheredCipherSeed] | None:
+    """Try ``passphrases`` in parallel worker processes.
+
+    Candidates are read lazily in chunks of ``chunk_size``, with about two
+    chunks per worker in flight at a time; the first match to come back is
+    returned and any chunks not yet started are cancelled.  Returns ``None``
+    when no candidate decrypts ``words``.
+    """
+    salt, ad, ciphertext = _split_cipher_bytes(words, word_to_index)
+    candidates = iter(passphrases)
+    chunks = iter(lambda: list(islice(candidates, chunk_size)), [])
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        running = set()
+        try:
+            while True:
+                for chunk in islice(chunks, window - len(running)):
+                    running.add(pool.submit(_try_passphrase_chunk, salt, ad, ciphertext, chunk))
+                if not running:
+                    return None
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    if result is not None:
+                        return result
+        finally:
+            for future in running:
+                future.cancel()
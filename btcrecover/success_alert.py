@@ -9,7 +9,7 @@ import subprocess
 import sys
 import threading
 import time
-from typing import Iterable, Optional, Sequence, TextIO
+from typing import Dict, Iterable, Optional, Sequence, TextIO, Tuple, Union
 
 try:
     import fcntl  # type: ignore
@@ -37,9 +37,20 @@ _console_bell_paths: tuple[str, ...] = _ENV_CONSOLE_PATHS or _DEFAULT_CONSOLE_PA
 _initial_console_bell_paths: tuple[str, ...] = _console_bell_paths
 _pcspeaker_available: Optional[bool] = None
 _pcspeaker_forced = False
+# Console paths and result of the last configure_pc_speaker(True) call, so
+# enabling it again with the same paths does not probe the devices again.
+_pcspeaker_configuration: Optional[Tuple[Tuple[str, ...], bool]] = None
+_pcspeaker_configure_lock = threading.Lock()
 _write_lock = threading.Lock()
 _beep_command_available: Optional[bool] = None
-_beep_command_path: Optional[str] = None
+# ``shutil.which`` is resolved once; the sentinel marks "not looked up yet" so a
+# missing command (``None``) is cached as well.
+_UNRESOLVED = object()
+_beep_command_path: Union[Optional[str], object] = _UNRESOLVED
+_beep_command_lock = threading.Lock()
+# Last known isatty() result per standard stream name, paired with the stream
+# object it was computed for so a replaced sys.stdout/sys.stderr is re-checked.
+_tty_cache: Dict[str, Tuple[TextIO, bool]] = {}
 
 
 def _console_bell_fd() -> Optional[int]:
@@ -56,13 +67,21 @@ def _console_bell_fd() -> Optional[int]:
 def _beep_command() -> Optional[str]:
     global _beep_command_path
 
-    if _beep_command_path:
-        return _beep_command_path
+    if _beep_command_path is _UNRESOLVED:
+        with _beep_command_lock:
+            if _beep_command_path is _UNRESOLVED:
+                _beep_command_path = shutil.which("beep")
+    return _beep_command_path  # type: ignore[return-value]
 
-    path = shutil.which("beep")
-    if path:
-        _beep_command_path = path
-    return _beep_command_path
+
+def _is_tty(name: str, stream: TextIO) -> bool:
+    cached = _tty_cache.get(name)
+    if cached is not None and cached[0] is stream:
+        return cached[1]
+
+    is_tty = bool(stream.isatty())
+    _tty_cache[name] = (stream, is_tty)
+    return is_tty
 
 
 def _emit_beep_command(duration_ms: int, frequency_hz: int) -> bool:
@@ -146,19 +165,39 @@ def configure_pc_speaker(
     :data:`False` when the PC speaker could not be prepared. Callers may still
     attempt playback even if ``False`` is returned as hardware support and
     privileges vary between systems.
+
+    Enabling the speaker again with the same console paths returns the earlier
+    result without probing the devices a second time; disable it first to
+    force a fresh probe.
     """
 
-    global _console_bell_paths, _pcspeaker_available, _pcspeaker_forced, _console_open_attempted
+    with _pcspeaker_configure_lock:
+        return _configure_pc_speaker(enable, console_paths)
 
-    _pcspeaker_forced = bool(enable)
+
+def _configure_pc_speaker(enable: bool, console_paths: Optional[Sequence[str]]) -> bool:
+    global _console_bell_paths, _pcspeaker_available, _pcspeaker_forced, _console_open_attempted
+    global _pcspeaker_configuration
 
     if enable:
         if console_paths is not None:
-            _console_bell_paths = tuple(path for path in console_paths if path)
+            paths = tuple(path for path in console_paths if path)
         elif not _ENV_CONSOLE_PATHS:
-            _console_bell_paths = _DEFAULT_CONSOLE_PATHS
+            paths = _DEFAULT_CONSOLE_PATHS
+        else:
+            paths = _console_bell_paths
+        if (
+            _pcspeaker_forced
+            and _pcspeaker_configuration is not None
+            and _pcspeaker_configuration[0] == paths
+        ):
+            return _pcspeaker_configuration[1]
+        _console_bell_paths = paths
     else:
         _console_bell_paths = _initial_console_bell_paths
+        _pcspeaker_configuration = None
+
+    _pcspeaker_forced = bool(enable)
 
     # Reset cached state so we re-open the console with the new configuration.
     _close_console_bell_stream()
@@ -176,11 +215,14 @@ def configure_pc_speaker(
     if stream is None:
         if _beep_command():
             _beep_command_available = None
-            return True
-        return False
+            ready = True
+        else:
+            ready = False
+    else:
+        ready = _console_bell_fd() is not None
 
-    fd = _console_bell_fd()
-    return fd is not None
+    _pcspeaker_configuration = (_console_bell_paths, ready)
+    return ready
 
 
 def _close_console_bell_stream() -> None:
@@ -229,10 +271,11 @@ def _bell_streams(skip_console: bool = False) -> Iterable[TextIO]:
         if stream is None:
             continue
         try:
-            if stream.isatty():
-                yield stream
+            is_tty = _is_tty(name, stream)
         except Exception:
             continue
+        if is_tty:
+            yield stream
 
     if not skip_console:
         console_stream = _ensure_console_bell_stream()
@@ -240,9 +283,19 @@ def _bell_streams(skip_console: bool = False) -> Iterable[TextIO]:
             yield console_stream
 
 
-def _emit_beeps(count: int, spacing: float = 0.2) -> None:
-    """Emit ``count`` terminal bell characters with ``spacing`` seconds between them."""
+def _emit_beeps(
+    count: int,
+    spacing: float = 0.2,
+    stop_event: Optional[threading.Event] = None,
+) -> None:
+    """Emit ``count`` terminal bell characters with ``spacing`` seconds between them.
 
+    Beeps are scheduled against a monotonic deadline so the time spent ringing
+    does not add drift. When ``stop_event`` is provided, setting it interrupts
+    the wait between beeps and abandons the rest of the sequence.
+    """
+
+    start = time.monotonic()
     for index in range(count):
         with _write_lock:
             pcspeaker = _emit_pc_speaker_beep(
@@ -267,7 +320,12 @@ def _emit_beeps(count: int, spacing: float = 0.2) -> None:
                     pass
 
         if index + 1 < count:
-            time.sleep(spacing)
+            delay = max(0.0, start + spacing * (index + 1) - time.monotonic())
+            if stop_event is not None:
+                if stop_event.wait(delay):
+                    return
+            else:
+                time.sleep(delay)
 
 
 def set_beep_on_find(enabled: bool) -> None:
@@ -287,12 +345,12 @@ def start_success_beep() -> None:
     if not _beep_enabled or _success_beep_thread is not None:
         return
 
-    _success_beep_stop_event = threading.Event()
+    stop_event = _success_beep_stop_event = threading.Event()
 
     def _beep_loop() -> None:
         while True:
-            _emit_beeps(2, spacing=1.5)
-            if _success_beep_stop_event.wait(10):
+            _emit_beeps(2, spacing=1.5, stop_event=stop_event)
+            if stop_event.wait(10):
                 break
 
     _success_beep_thread = threading.Thread(
@@ -345,10 +403,26 @@ def wait_for_user_to_stop(prompt: str = "\nPress Enter to stop the success alert
         pass
 
 
-def beep_failure_once() -> None:
-    """Emit a single terminal bell when a recovery attempt fails."""
+def beep_failure_once() -> threading.Event:
+    """Emit a single terminal bell when a recovery attempt fails.
 
+    The bell is rung from a background thread so a slow console or the
+    external ``beep`` utility does not hold up the caller. The returned event
+    is set once the beep has been emitted, or straight away when beeping is
+    disabled. The thread is not a daemon, so the beep still completes if the
+    program exits right after calling this.
+    """
+
+    done = threading.Event()
     if not _beep_enabled:
-        return
+        done.set()
+        return done
+
+    def _beep() -> None:
+        try:
+            _emit_beeps(1)
+        finally:
+            done.set()
 
-    _emit_beeps(1)
+    threading.Thread(target=_beep, name="failure_beep").start()
+    return done
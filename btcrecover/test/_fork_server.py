@@ -0,0 +1,249 @@
+"""Fork server shared by the test harnesses that run CLI scripts.
+
+Starting a fresh interpreter for every script run spends most of its time on
+start-up and imports.  A fork server is started once, loads whatever its
+runs have in common, and then forks a child per request, so each run still
+gets a process of its own but skips that start-up.
+
+The protocol is line-based JSON.  Once loaded the server writes
+``{"ready": true}``; each request on stdin is a JSON object with an ``"id"``
+plus whatever the server's run function needs.  Once the child is forked the
+server replies ``{"id": ..., "pid": ...}``, and when it exits, possibly out of
+order, ``{"id": ..., "returncode": ..., "stdout": ..., "stderr": ...}``.  Each
+child leads its own process group, so a client that gives up on a run can
+kill it along with anything it started.
+
+Requests are read and children forked and reaped from a single thread;
+forking while other threads are running can leave the child holding locks
+that will never be released.
+
+This module only uses the standard library, and ``run-all-tests.py`` loads it
+by path, so that its server starts without importing btcrecover.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import select
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import traceback
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import IO, Callable, Dict, Optional, Sequence, Tuple
+
+# How often the server checks for finished children while waiting for requests
+_REAP_INTERVAL = 0.05
+
+
+def _send(message: dict) -> None:
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+
+def _run_child(run: Callable[[dict], Optional[int]], request: dict, stdout_fd: int, stderr_fd: int) -> None:
+    """Call *run* for *request* in a freshly forked child; never returns."""
+
+    os.setpgid(0, 0)
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(stdout_fd, 1)
+    os.dup2(stderr_fd, 2)
+
+    try:
+        code = run(request)
+    except SystemExit as exc:
+        code = exc.code
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+
+    if code is None:
+        code = 0
+    elif not isinstance(code, int):
+        print(code, file=sys.stderr)
+        code = 1
+
+    try:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    finally:
+        os._exit(code)
+
+
+def _start(run: Callable[[dict], Optional[int]], request: dict, merge_stderr: bool) -> Tuple[int, Tuple[IO[bytes], ...]]:
+    """Fork a child for *request*, returning its pid and output files."""
+
+    outputs = (tempfile.TemporaryFile(),) if merge_stderr else (tempfile.TemporaryFile(), tempfile.TemporaryFile())
+    pid = os.fork()
+    if pid == 0:
+        _run_child(run, request, outputs[0].fileno(), outputs[-1].fileno())
+    try:
+        os.setpgid(pid, pid)  # also done by the child; whichever runs first wins
+    except OSError:
+        pass
+    _send({"id": request["id"], "pid": pid})
+    return pid, outputs
+
+
+def _finish(request_id: int, outputs: Tuple[IO[bytes], ...], status: int) -> None:
+    texts = []
+    for output in outputs:
+        with output:
+            output.seek(0)
+            texts.append(output.read().decode("utf-8", errors="replace"))
+    _send({
+        "id":         request_id,
+        "returncode": os.waitstatus_to_exitcode(status),
+        "stdout":     texts[0],
+        "stderr":     texts[1] if len(texts) > 1 else "",
+    })
+
+
+def serve(run: Callable[[dict], Optional[int]], merge_stderr: bool = False) -> None:
+    """Serve requests from stdin until it closes and every child has exited.
+
+    *run* is called in the child with the request and returns its exit code,
+    or ``None`` for success; it may also raise ``SystemExit``.  With
+    *merge_stderr* the child's stderr goes to the same place as its stdout
+    and responses carry an empty ``stderr``.
+    """
+
+    _send({"ready": True})
+
+    children: Dict[int, Tuple[int, Tuple[IO[bytes], ...]]] = {}
+    stdin_fd = sys.stdin.fileno()
+    unread = b""
+    try:
+        while stdin_fd is not None or children:
+            if stdin_fd is not None:
+                readable, _, _ = select.select([stdin_fd], [], [], _REAP_INTERVAL if children else None)
+                if readable:
+                    data = os.read(stdin_fd, 65536)
+                    if not data:
+                        stdin_fd = None
+                    *lines, unread = (unread + data).split(b"\n")
+                    for line in lines:
+                        if line.strip():
+                            request = json.loads(line)
+                            pid, outputs = _start(run, request, merge_stderr)
+                            children[pid] = request["id"], outputs
+
+            # Once stdin is closed there is nothing left to do but wait
+            while children:
+                pid, status = os.waitpid(-1, os.WNOHANG if stdin_fd is not None else 0)
+                if pid == 0:
+                    break
+                if pid in children:
+                    _finish(*children.pop(pid), status)
+    finally:
+        for pid in children:
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except OSError:
+                pass
+
+
+class Client:
+    """Starts a fork server with *args* and runs requests through it.
+
+    Requests may be issued from several threads; responses are matched up by
+    id.  Check :attr:`ready` before use: it is false if the server failed to
+    start, in which case it has already been closed.
+    """
+
+    def __init__(self, args: Sequence[str], cwd: str, env: Dict[str, str]) -> None:
+        self._process = subprocess.Popen(
+            list(args),
+            cwd=str(cwd),
+            env=env,
+            text=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._pending: Dict[int, Tuple[Sequence[str], Future]] = {}
+        self._pids: Dict[int, int] = {}
+        self.ready = self._process.stdout.readline().strip() == json.dumps({"ready": True})
+        if not self.ready:
+            self.close()
+            return
+        threading.Thread(target=self._read_responses, daemon=True).start()
+
+    def _read_responses(self) -> None:
+        for line in self._process.stdout:
+            response = json.loads(line)
+            with self._lock:
+                if "pid" in response:
+                    self._pids[response["id"]] = response["pid"]
+                    continue
+                self._pids.pop(response["id"], None)
+                command, future = self._pending.pop(response["id"])
+            future.set_result(
+                subprocess.CompletedProcess(command, response["returncode"], response["stdout"], response["stderr"])
+            )
+
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        for command, future in pending.values():
+            future.set_exception(RuntimeError("fork server exited unexpectedly"))
+
+    def _kill(self, request_id: int) -> None:
+        """Kill the child running *request_id* and anything it started."""
+
+        with self._lock:
+            pid = self._pids.get(request_id)
+        if pid is not None:
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except OSError:
+                pass
+
+    def run(self, command: Sequence[str], request: dict, timeout: Optional[float] = None) -> subprocess.CompletedProcess:
+        """Run *request* in a forked child.
+
+        *command* is the equivalent command line, used in the result and in
+        errors.  Like ``subprocess.run()``, a run that takes longer than
+        *timeout* seconds is killed and ``subprocess.TimeoutExpired`` raised.
+        """
+
+        future: Future = Future()
+        with self._lock:
+            request_id = next(self._ids)
+            self._pending[request_id] = (command, future)
+            self._process.stdin.write(json.dumps({**request, "id": request_id}) + "\n")
+            self._process.stdin.flush()
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            pass
+
+        # Report whatever the run had printed before it was killed
+        self._kill(request_id)
+        try:
+            result = future.result(timeout=10)
+        except (FutureTimeoutError, RuntimeError):
+            result = subprocess.CompletedProcess(command, None)
+        raise subprocess.TimeoutExpired(list(command), timeout, output=result.stdout, stderr=result.stderr)
+
+    def close(self) -> None:
+        with self._lock:
+            request_ids = list(self._pids)
+        for request_id in request_ids:
+            self._kill(request_id)
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._process.wait(timeout=120)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._process.stdout.close()
@@ -0,0 +1,47 @@
+"""Fork server that runs the CLI scripts for the usage-example tests.
+
+Starting a fresh interpreter for every usage example spends most of its time
+importing btcrecover and its wallet libraries before any recovery work runs.
+This worker imports ``btcrecover.py`` and ``seedrecover.py`` once and then
+forks a child per request, so each example still runs in its own isolated
+process but starts with every module already loaded.
+
+Requests follow the :mod:`btcrecover.test._fork_server` protocol and carry
+``"script"`` and ``"argv"``; the ``stdout`` of each response holds the
+combined stdout and stderr of the run.
+"""
+
+from __future__ import annotations
+
+import functools
+import runpy
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Sequence
+
+from btcrecover.test import _fork_server
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS = ("btcrecover.py", "seedrecover.py")
+
+
+def _load_scripts() -> Dict[str, Callable[[Sequence[str]], int]]:
+    """Import each script without running its ``__main__`` block."""
+
+    return {
+        script: runpy.run_path(str(REPO_ROOT / script), run_name="_test_worker")["main"]
+        for script in SCRIPTS
+    }
+
+
+def _run_script(scripts: Dict[str, Callable[[Sequence[str]], int]], request: dict) -> int:
+    sys.argv = [str(REPO_ROOT / request["script"]), *request["argv"]]
+    return scripts[request["script"]](list(request["argv"]))
+
+
+def main() -> None:
+    _fork_server.serve(functools.partial(_run_script, _load_scripts()), merge_stderr=True)
+
+
+if __name__ == "__main__":
+    main()
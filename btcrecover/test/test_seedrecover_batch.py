@@ -0,0 +1,192 @@
+"""Tests for the batch seed runner in seedrecover_batch.py."""
+
+from __future__ import annotations
+
+import importlib.util
+import multiprocessing
+import os
+import signal
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _load_seedrecover_batch():
+    """Import seedrecover_batch.py, which lives outside the package, by path."""
+
+    if str(REPO_ROOT) not in sys.path:
+        sys.path.insert(0, str(REPO_ROOT))
+    spec = importlib.util.spec_from_file_location(
+        "seedrecover_batch", REPO_ROOT / "seedrecover_batch.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # the worker pool pickles its functions by module name
+    spec.loader.exec_module(module)
+    return module
+
+
+seedrecover_batch = _load_seedrecover_batch()
+
+
+def _fake_seedrecover(argv):
+    """Stand-in for btcrseed.main() which decides the outcome from the seed."""
+
+    seed = argv[argv.index("--mnemonic") + 1]
+    if seed.startswith("slow"):
+        time.sleep(60)
+    if seed == "crash":
+        os._exit(1)  # as if the worker had been killed outright
+    if seed == "interrupt":
+        os.kill(os.getppid(), signal.SIGINT)  # as if Ctrl-C had been pressed
+        time.sleep(60)
+    return (seed, None) if seed == "match" else (False, None)
+
+
+def _seed_jobs(*seeds):
+    return [(seed, ["--mnemonic", seed]) for seed in seeds]
+
+
+class TestBatchArguments(unittest.TestCase):
+
+    def parse(self, *args):
+        with mock.patch.object(sys, "argv", ["seedrecover_batch.py"]):
+            return seedrecover_batch._parse_batch_arguments(["seedrecover_batch.py", *args])
+
+    def test_defaults(self):
+        parsed = self.parse("--wallet-type", "bip39")
+        self.assertEqual(parsed[0], "batch_seeds.txt")
+        self.assertEqual(parsed[1], "batch_seeds.txt.progress")
+        self.assertIsNone(parsed[2])
+        self.assertEqual(parsed[8], 1)
+        self.assertFalse(parsed[9])
+
+    def test_jobs_and_worker_hash(self):
+        parsed = self.parse("--batch-jobs", "4", "--batch-worker", "1,3/4", "--batch-worker-hash")
+        self.assertEqual(parsed[2], [0, 2])
+        self.assertEqual(parsed[3], 4)
+        self.assertEqual(parsed[8], 4)
+        self.assertTrue(parsed[9])
+
+    def test_jobs_must_be_positive(self):
+        with mock.patch("sys.stderr"), self.assertRaises(SystemExit):
+            self.parse("--batch-jobs", "0")
+
+
+class TestBatchWorkList(unittest.TestCase):
+
+    LINES = ["one\n", "# comment\n", "two # note\n", "\n", "three\n", "four\n", "five\n"]
+    SEEDS = ["one", "two", "three", "four", "five"]
+
+    def work_list(self, worker_ids=None, workers_total=None, completed=(), shard_by_hash=False):
+        completed_seeds = seedrecover_batch._CompletedSeeds()
+        for seed in completed:
+            completed_seeds.add(seed)
+        with mock.patch("builtins.print"):
+            return seedrecover_batch._batch_work_list(
+                self.LINES, worker_ids, workers_total, completed_seeds, shard_by_hash
+            )
+
+    def test_parses_lines(self):
+        self.assertEqual(self.work_list(), self.SEEDS)
+
+    def test_position_shards(self):
+        self.assertEqual(self.work_list([0], 2), ["one", "three", "five"])
+        self.assertEqual(self.work_list([1], 2), ["two", "four"])
+        self.assertEqual(self.work_list([0, 2], 3), ["one", "three", "four"])
+
+    def test_completed_seeds_keep_their_shard(self):
+        self.assertEqual(self.work_list([0], 2, completed=["one"]), ["three", "five"])
+
+    def test_hash_shards(self):
+        shards = [self.work_list([worker_id], 3, shard_by_hash=True) for worker_id in range(3)]
+        self.assertEqual(sorted(seed for shard in shards for seed in shard), sorted(self.SEEDS))
+        for worker_id, shard in enumerate(shards):
+            for seed in shard:
+                self.assertEqual(seedrecover_batch._seed_shard(seed, 3), worker_id)
+
+    def test_hash_shards_ignore_order(self):
+        forwards = self.work_list([1], 3, shard_by_hash=True)
+        self.LINES = self.LINES[::-1]
+        self.assertEqual(sorted(self.work_list([1], 3, shard_by_hash=True)), sorted(forwards))
+
+
+class TestLimitThreads(unittest.TestCase):
+
+    def test_single_job_unchanged(self):
+        self.assertEqual(seedrecover_batch._limit_threads(["--wallet-type", "bip39"], 1),
+                         ["--wallet-type", "bip39"])
+
+    def test_threads_split_between_jobs(self):
+        with mock.patch.object(seedrecover_batch.os, "cpu_count", return_value=8):
+            self.assertEqual(seedrecover_batch._limit_threads(["--wallet-type", "bip39"], 3),
+                             ["--wallet-type", "bip39", "--threads", "2"])
+            self.assertEqual(seedrecover_batch._limit_threads([], 16), ["--threads", "1"])
+
+    def test_given_threads_kept(self):
+        for argv in (["--threads", "4"], ["--threads=4"], ["--thr", "4"], ["--thr=4"]):
+            with self.subTest(argv=argv):
+                self.assertEqual(seedrecover_batch._limit_threads(argv, 2), argv)
+
+
+@unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(),
+                     "the stubbed btcrseed.main() only reaches forked workers")
+class TestParallelSeeds(unittest.TestCase):
+
+    def setUp(self):
+        patches = (
+            mock.patch.object(seedrecover_batch.btcrseed, "main", _fake_seedrecover),
+            mock.patch.object(seedrecover_batch.btcrseed, "register_autodetecting_wallets"),
+            mock.patch.object(seedrecover_batch, "_worker_context",
+                              lambda: multiprocessing.get_context("fork")),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_all_seeds_run(self):
+        results = seedrecover_batch._seed_results(_seed_jobs("a", "b", "c", "d", "e"), 2)
+        self.assertEqual(sorted((seed, result) for seed, _, result in results),
+                         [(seed, (False, None)) for seed in "abcde"])
+
+    def test_stops_on_match(self):
+        started = []
+
+        def seeds():
+            for seed_job in _seed_jobs("slow1", "match", "slow2", "slow3"):
+                started.append(seed_job[0])
+                yield seed_job
+
+        start = time.monotonic()
+        results = seedrecover_batch._seed_results(seeds(), 2)
+        for seed, _, result in results:
+            if result[0]:
+                results.close()
+                break
+        self.assertEqual(seed, "match")
+        self.assertLess(time.monotonic() - start, 30)
+        self.assertEqual(started, ["slow1", "match"])
+        self.assertEqual(multiprocessing.active_children(), [])
+
+    def test_dead_worker_reported_as_error(self):
+        # The seed running alongside the crash is lost with the pool; the
+        # seeds after it run in a fresh one
+        results = {seed: result for seed, _, result in
+                   seedrecover_batch._seed_results(_seed_jobs("crash", "slow1", "a", "b"), 2)}
+        self.assertEqual(results, {"crash": None, "slow1": None, "a": (False, None), "b": (False, None)})
+
+    def test_interrupt_reports_running_seeds(self):
+        seen = []
+        with self.assertRaises(KeyboardInterrupt):
+            for seed, _, result in seedrecover_batch._seed_results(_seed_jobs("slow1", "interrupt", "a"), 2):
+                seen.append((seed, result))
+        self.assertEqual(sorted(seen), [("interrupt", None), ("slow1", None)])
+        self.assertEqual(multiprocessing.active_children(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
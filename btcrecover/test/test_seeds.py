@@ -25,7 +25,7 @@ import warnings, unittest, os, tempfile, shutil, filecmp, sys, hashlib, random,
 
 if __name__ == '__main__':
     sys.path.append(os.path.join(os.path.dirname(__file__), "..", ".."))
-from btcrecover import aezeed, btcrpass, btcrseed
+from btcrecover import aezeed, btcrpass, btcrseed, trezor_common_mistakes
 from btcrecover.addressset import AddressSet
 import btcrecover.opencl_helpers
 
@@ -240,6 +240,33 @@ class TestAezeedModule(unittest.TestCase):
                 _AEZEED_CUSTOM_MNEMONIC.split(), "wrong", self.word_to_index
             )
 
+    def test_try_passphrases(self):
+        matches = list(aezeed.try_passphrases(
+            _AEZEED_CUSTOM_MNEMONIC.split(),
+            ["wrong", "!very_safe_55345_password*", ""],
+            self.word_to_index,
+        ))
+        self.assertEqual(len(matches), 1)
+        passphrase, seed = matches[0]
+        self.assertEqual(passphrase, "!very_safe_55345_password*")
+        self.assertEqual(seed.entropy, _AEZEED_ENTROPY)
+
+    def test_decode_mnemonic_batch(self):
+        result = aezeed.decode_mnemonic_batch(
+            _AEZEED_CUSTOM_MNEMONIC.split(),
+            ["wrong", "!very_safe_55345_password*", ""],
+            self.word_to_index,
+            max_workers=2,
+            chunk_size=1,
+        )
+        self.assertIsNotNone(result)
+        passphrase, seed = result
+        self.assertEqual(passphrase, "!very_safe_55345_password*")
+        self.assertEqual(seed.entropy, _AEZEED_ENTROPY)
+        self.assertIsNone(aezeed.decode_mnemonic_batch(
+            _AEZEED_CUSTOM_MNEMONIC.split(), ["wrong"], self.word_to_index, max_workers=1
+        ))
+
     def test_wallet_derivation(self):
         wallet = btcrseed.WalletAezeed.create_from_params(
             addresses=["1Hp6UXuJjzt9eSBa9LhtW97KPb44bq4CAQ"],
@@ -2102,6 +2129,36 @@ class TestRecoverySeedListsGenerators(unittest.TestCase):
         generated_passwords = list(tok_it)
         self.assertEqual(generated_passwords, correct_seedlist)
 
+class TestTrezorCommonMistakes(unittest.TestCase):
+
+    def test_frozen_mapping_matches_groups(self):
+        # The shipped literal must be regenerated (utilities/gen_trezor_mistakes.py)
+        # whenever the groups change; compare items so the order is checked too
+        expected = trezor_common_mistakes._build_mistake_mapping(
+            trezor_common_mistakes.TREZOR_COMMON_MISTAKE_GROUPS
+        )
+        self.assertEqual(
+            list(trezor_common_mistakes.TREZOR_COMMON_MISTAKES.items()),
+            list(expected.items()),
+        )
+
+    def test_mistake_sets_match_tuples(self):
+        self.assertEqual(
+            trezor_common_mistakes.TREZOR_COMMON_MISTAKES_SET,
+            {
+                word: frozenset(alternatives)
+                for word, alternatives in trezor_common_mistakes.TREZOR_COMMON_MISTAKES.items()
+            },
+        )
+        self.assertIn("cable", trezor_common_mistakes.TREZOR_COMMON_MISTAKES_SET["able"])
+        self.assertNotIn("able", trezor_common_mistakes.TREZOR_COMMON_MISTAKES_SET["able"])
+
+    def test_confusion_translation(self):
+        translation = trezor_common_mistakes.TREZOR_CONFUSION_TRANSLATION
+        self.assertEqual("c00k".translate(translation), "cook")
+        self.assertEqual("5ma1l".translate(translation), "small")
+        self.assertEqual("table".translate(translation), "table")
+
 class TestPhaseTransforms(unittest.TestCase):
     class DummyWallet:
         def __init__(self, speed):
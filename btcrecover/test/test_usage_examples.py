@@ -5,11 +5,14 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, Sequence, Tuple
+from typing import Iterable, Optional, Sequence, Tuple
 
 import unittest
 
+from btcrecover.test import _fork_server
+
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 PYTHON_EXECUTABLE = sys.executable
@@ -23,19 +26,24 @@ def _command(script: str, *args: str) -> list[str]:
     return [PYTHON_EXECUTABLE, str(REPO_ROOT / script), *args]
 
 
-def _run_command(command: Sequence[str]) -> subprocess.CompletedProcess[str]:
-    """Execute *command* in the repository root and capture output."""
+def _command_env() -> dict[str, str]:
+    """Return the environment for commands run from the repository root."""
 
     env = os.environ.copy()
     pythonpath_entries = [str(REPO_ROOT)]
     if env.get("PYTHONPATH"):
         pythonpath_entries.append(env["PYTHONPATH"])
     env["PYTHONPATH"] = os.pathsep.join(pythonpath_entries)
+    return env
+
+
+def _run_command(command: Sequence[str]) -> subprocess.CompletedProcess[str]:
+    """Execute *command* in the repository root and capture output."""
 
     return subprocess.run(
         command,
         cwd=str(REPO_ROOT),
-        env=env,
+        env=_command_env(),
         text=True,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
@@ -44,28 +52,107 @@ def _run_command(command: Sequence[str]) -> subprocess.CompletedProcess[str]:
     )
 
 
+def _test_jobs() -> int:
+    """Return how many usage examples may run at once.
+
+    Defaults to the CPU count; set ``BTCRECOVER_TEST_JOBS`` to override it
+    (``1`` runs the examples serially).  When more than one runs at a time,
+    :meth:`CommandTestCase.run_examples` gives each example ``--threads 1``,
+    since every btcrecover/seedrecover run would otherwise start a worker per
+    CPU of its own and the machine would end up with CPU-count squared
+    processes competing for it.
+    """
+
+    try:
+        return max(1, int(os.environ["BTCRECOVER_TEST_JOBS"]))
+    except (KeyError, ValueError):
+        return os.cpu_count() or 1
+
+
+class _ScriptWorker(_fork_server.Client):
+    """Client for the ``_test_worker`` fork server.
+
+    The worker imports the CLI scripts once and forks a child per command, so
+    each example skips interpreter start-up and module imports.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(
+            [PYTHON_EXECUTABLE, "-m", "btcrecover.test._test_worker"], str(REPO_ROOT), _command_env()
+        )
+
+    def run_command(self, command: Sequence[str], timeout: float = 120) -> subprocess.CompletedProcess[str]:
+        """Run *command* (as built by :func:`_command`) in a forked child."""
+
+        request = {"script": Path(command[1]).name, "argv": list(command[2:])}
+        return self.run(command, request, timeout)
+
+
+def _use_worker() -> bool:
+    """Whether examples should run through the fork server.
+
+    Needs ``os.fork``; set ``BTCRECOVER_TEST_WORKER=0`` to start a fresh
+    interpreter for every example instead.
+    """
+
+    return hasattr(os, "fork") and os.environ.get("BTCRECOVER_TEST_WORKER", "1") != "0"
+
+
 class CommandTestCase(unittest.TestCase):
     """Base class that provides helpers for invoking CLI usage examples."""
 
     expected_phrase: str
+    _worker: Optional[_ScriptWorker] = None
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        if _use_worker():
+            worker = _ScriptWorker()
+            # If the scripts fail to import, fall back to plain subprocesses so
+            # each example reports the real error in its own output.
+            cls._worker = worker if worker.ready else None
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        if cls._worker is not None:
+            cls._worker.close()
+            cls._worker = None
+        super().tearDownClass()
+
+    def _run(self, command: Sequence[str]) -> subprocess.CompletedProcess[str]:
+        if self._worker is not None:
+            return self._worker.run_command(command)
+        return _run_command(command)
 
     def run_examples(self, examples: Iterable[Tuple[str, Sequence[str]]]) -> None:
-        for description, command in examples:
-            with self.subTest(description=description):
-                result = _run_command(command)
-                if result.returncode != 0:
-                    self.fail(
-                        "Command '{}' exited with {}\nOutput:\n{}".format(
-                            " ".join(command), result.returncode, result.stdout
+        # The examples are independent subprocesses, so start them all at once
+        # and then check the results in their original order.  Running in
+        # parallel, each one gets a single worker thread (see _test_jobs()).
+        jobs = _test_jobs()
+        if jobs > 1:
+            examples = [(description, [*command, "--threads", "1"]) for description, command in examples]
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            pending = [
+                (description, command, pool.submit(self._run, command))
+                for description, command in examples
+            ]
+            for description, command, future in pending:
+                with self.subTest(description=description):
+                    result = future.result()
+                    if result.returncode != 0:
+                        self.fail(
+                            "Command '{}' exited with {}\nOutput:\n{}".format(
+                                " ".join(command), result.returncode, result.stdout
+                            )
                         )
+                    self.assertIn(
+                        self.expected_phrase,
+                        result.stdout,
+                        msg="Command '{}' did not report {}\nOutput:\n{}".format(
+                            " ".join(command), self.expected_phrase, result.stdout
+                        ),
                     )
-                self.assertIn(
-                    self.expected_phrase,
-                    result.stdout,
-                    msg="Command '{}' did not report {}\nOutput:\n{}".format(
-                        " ".join(command), self.expected_phrase, result.stdout
-                    ),
-                )
 
 
 class TestBasicPasswordUsageExamples(CommandTestCase):
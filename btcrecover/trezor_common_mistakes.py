@@ -4,12 +4,16 @@ The source data mirrors the list published by Trezor and groups together
 words which are frequently confused with each other.  The
 ``TREZOR_COMMON_MISTAKE_GROUPS`` constant preserves the original groupings,
 while ``TREZOR_COMMON_MISTAKES`` expands the groups into a mapping that can be
-used by the seed transformation generators.
+used by the seed transformation generators.  ``TREZOR_COMMON_MISTAKES_SET``
+holds the same alternatives as frozensets for constant-time membership tests.
+The expanded mapping is stored as a pre-generated literal; regenerate it with
+``utilities/gen_trezor_mistakes.py`` after editing the groups.
 """
 
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Sequence, Tuple
+import sys
+from typing import Dict, FrozenSet, Iterable, Sequence, Tuple
 
 TREZOR_COMMON_MISTAKE_GROUPS: Sequence[Tuple[str, ...]] = (
     ("able", "cable", "table"),
@@ -168,25 +172,378 @@ TREZOR_COMMON_MISTAKE_GROUPS: Sequence[Tuple[str, ...]] = (
 def _build_mistake_mapping(
     groups: Iterable[Sequence[str]],
 ) -> Dict[str, Tuple[str, ...]]:
-    mapping: Dict[str, List[str]] = {}
+    """Expand *groups* into a word -> alternatives mapping.
+
+    Only ``utilities/gen_trezor_mistakes.py`` and the tests call this; the
+    module itself ships the result as the literal below so importing it does
+    not rebuild the table.
+    """
+    # Dict keys act as an insertion-ordered set, so duplicates are dropped in
+    # O(1) while the alternatives keep their first-seen order.
+    mapping: Dict[str, Dict[str, None]] = {}
     for group in groups:
-        normalized = tuple(word.strip().lower() for word in group if word)
+        # Interned like the identifier-shaped literals in the generated
+        # mapping (and the loaded wordlists), so equal words share one object
+        normalized = tuple(sys.intern(word.strip().lower()) for word in group if word)
         for idx, word in enumerate(normalized):
             others = normalized[:idx] + normalized[idx + 1 :]
             if not others:
                 continue
-            alternatives = mapping.setdefault(word, [])
+            alternatives = mapping.setdefault(word, {})
             for other in others:
-                if other not in alternatives:
-                    alternatives.append(other)
+                alternatives[other] = None
     return {word: tuple(alternatives) for word, alternatives in mapping.items()}
 
 
-TREZOR_COMMON_MISTAKES: Dict[str, Tuple[str, ...]] = _build_mistake_mapping(
-    TREZOR_COMMON_MISTAKE_GROUPS
-)
+# BEGIN GENERATED TREZOR_COMMON_MISTAKES
+# Produced by utilities/gen_trezor_mistakes.py; do not edit by hand.
+TREZOR_COMMON_MISTAKES: Dict[str, Tuple[str, ...]] = {
+    "able": ("cable", "table"),
+    "cable": ("able", "table"),
+    "table": ("able", "cable"),
+    "across": ("cross",),
+    "cross": ("across",),
+    "act": ("art", "cat", "pact"),
+    "art": ("act", "cat", "pact", "arm", "army", "farm", "warm", "cart"),
+    "cat": ("act", "art", "pact", "can", "car", "fan", "man", "scan", "van", "card", "cart", "jar", "chat", "fat", "hat"),
+    "pact": ("act", "art", "cat"),
+    "action": ("auction",),
+    "auction": ("action",),
+    "add": ("dad",),
+    "dad": ("add", "day", "mad", "sad"),
+    "again": ("gain",),
+    "gain": ("again",),
+    "age": ("cage", "page", "wage"),
+    "cage": ("age", "page", "wage", "cake", "case", "cave"),
+    "page": ("age", "cage", "wage", "cake", "case", "cave"),
+    "wage": ("age", "cage", "page", "cake", "case", "cave"),
+    "ahead": ("head",),
+    "head": ("ahead",),
+    "aim": ("air", "arm"),
+    "air": ("aim", "arm", "hair", "pair"),
+    "arm": ("aim", "air", "army", "art", "farm", "warm"),
+    "hair": ("air", "pair", "chair"),
+    "pair": ("air", "hair"),
+    "all": ("ball", "call", "fall", "ill", "wall"),
+    "ball": ("all", "call", "fall", "ill", "wall"),
+    "call": ("all", "ball", "fall", "ill", "wall", "calm"),
+    "fall": ("all", "ball", "call", "ill", "wall", "calm"),
+    "ill": ("all", "ball", "call", "fall", "wall"),
+    "wall": ("all", "ball", "call", "fall", "ill", "calm"),
+    "alley": ("valley",),
+    "valley": ("alley",),
+    "alter": ("later",),
+    "later": ("alter",),
+    "anger": ("danger",),
+    "danger": ("anger",),
+    "angle": ("ankle",),
+    "ankle": ("angle",),
+    "arch": ("march",),
+    "march": ("arch",),
+    "area": ("arena",),
+    "arena": ("area",),
+    "army": ("arm", "art", "farm", "warm"),
+    "farm": ("arm", "army", "art", "warm"),
+    "warm": ("arm", "army", "art", "farm"),
+    "around": ("round",),
+    "round": ("around",),
+    "arrow": ("narrow",),
+    "narrow": ("arrow",),
+    "cart": ("art", "car", "card", "cat", "jar", "hard", "yard"),
+    "ask": ("mask", "task"),
+    "mask": ("ask", "task"),
+    "task": ("ask", "mask"),
+    "aunt": ("hunt",),
+    "hunt": ("aunt",),
+    "avoid": ("void",),
+    "void": ("avoid",),
+    "awake": ("aware",),
+    "aware": ("awake",),
+    "away": ("way",),
+    "way": ("away", "day", "dry", "say"),
+    "bag": ("bar", "tag"),
+    "bar": ("bag", "tag", "car", "jar"),
+    "tag": ("bag", "bar"),
+    "car": ("bar", "jar", "can", "cat", "fan", "man", "scan", "van", "card", "cart"),
+    "jar": ("bar", "car", "card", "cart", "cat"),
+    "base": ("case",),
+    "case": ("base", "cage", "cake", "cave", "page", "wage", "lake", "make", "cash", "cause", "chase"),
+    "battle": ("cattle",),
+    "cattle": ("battle", "castle"),
+    "beach": ("bench", "teach"),
+    "bench": ("beach", "teach"),
+    "teach": ("beach", "bench"),
+    "bean": ("mean",),
+    "mean": ("bean",),
+    "belt": ("best", "melt"),
+    "best": ("belt", "melt", "nest", "test", "west"),
+    "melt": ("belt", "best"),
+    "nest": ("best", "test", "west"),
+    "test": ("best", "nest", "west"),
+    "west": ("best", "nest", "test"),
+    "better": ("bitter", "butter", "letter"),
+    "bitter": ("better", "butter", "letter"),
+    "butter": ("better", "bitter", "letter"),
+    "letter": ("better", "bitter", "butter"),
+    "bid": ("bind", "bird", "kid"),
+    "bind": ("bid", "bird", "kid", "blind", "find", "kind", "mind"),
+    "bird": ("bid", "bind", "kid", "blind", "find", "kind", "mind"),
+    "kid": ("bid", "bind", "bird"),
+    "bike": ("like",),
+    "like": ("bike",),
+    "blind": ("bind", "bird", "find", "kind", "mind"),
+    "find": ("bind", "bird", "blind", "kind", "mind"),
+    "kind": ("bind", "bird", "blind", "find", "mind"),
+    "mind": ("bind", "bird", "blind", "find", "kind"),
+    "blade": ("blame",),
+    "blame": ("blade", "flame"),
+    "flame": ("blame",),
+    "blue": ("blur", "glue"),
+    "blur": ("blue", "glue"),
+    "glue": ("blue", "blur"),
+    "blush": ("brush", "flush", "slush"),
+    "brush": ("blush", "flush", "slush", "crush"),
+    "flush": ("blush", "brush", "slush"),
+    "slush": ("blush", "brush", "flush"),
+    "boat": ("goat",),
+    "goat": ("boat",),
+    "body": ("boy",),
+    "boy": ("body", "box", "fox", "joy", "toy"),
+    "boil": ("coil", "foil", "oil"),
+    "coil": ("boil", "foil", "oil", "coin", "cool"),
+    "foil": ("boil", "coil", "oil", "coin", "cool"),
+    "oil": ("boil", "coil", "foil", "coin", "cool"),
+    "bone": ("one", "tone", "zone"),
+    "one": ("bone", "tone", "zone"),
+    "tone": ("bone", "one", "zone"),
+    "zone": ("bone", "one", "tone"),
+    "book": ("cook",),
+    "cook": ("book", "cool"),
+    "border": ("order",),
+    "order": ("border",),
+    "boring": ("bring",),
+    "bring": ("boring", "ring"),
+    "boss": ("toss",),
+    "toss": ("boss",),
+    "box": ("boy", "fox"),
+    "fox": ("box", "boy"),
+    "joy": ("boy", "toy"),
+    "toy": ("boy", "joy"),
+    "brain": ("grain", "rain", "train"),
+    "grain": ("brain", "rain", "train"),
+    "rain": ("brain", "grain", "train"),
+    "train": ("brain", "grain", "rain"),
+    "brass": ("grass",),
+    "grass": ("brass",),
+    "brick": ("brisk", "trick"),
+    "brisk": ("brick", "trick", "risk"),
+    "trick": ("brick", "brisk"),
+    "bridge": ("ridge",),
+    "ridge": ("bridge",),
+    "brief": ("grief",),
+    "grief": ("brief",),
+    "bright": ("right",),
+    "right": ("bright",),
+    "ring": ("bring",),
+    "risk": ("brisk",),
+    "broom": ("room",),
+    "room": ("broom",),
+    "brown": ("frown",),
+    "frown": ("brown",),
+    "crush": ("brush", "crash", "trash"),
+    "bulb": ("bulk",),
+    "bulk": ("bulb",),
+    "bus": ("busy",),
+    "busy": ("bus",),
+    "cake": ("cage", "case", "cave", "page", "wage", "lake", "make"),
+    "cave": ("cage", "cake", "case", "page", "wage", "lake", "make", "cash", "cause", "chase", "have", "pave", "save", "wave"),
+    "lake": ("cake", "case", "cave", "make"),
+    "make": ("cake", "case", "cave", "lake"),
+    "calm": ("call", "fall", "wall", "palm"),
+    "palm": ("calm",),
+    "camp": ("damp", "lamp", "ramp"),
+    "damp": ("camp", "lamp", "ramp"),
+    "lamp": ("camp", "damp", "ramp"),
+    "ramp": ("camp", "damp", "lamp"),
+    "can": ("car", "cat", "fan", "man", "scan", "van"),
+    "fan": ("can", "car", "cat", "man", "scan", "van"),
+    "man": ("can", "car", "cat", "fan", "scan", "van"),
+    "scan": ("can", "car", "cat", "fan", "man", "van"),
+    "van": ("can", "car", "cat", "fan", "man", "scan"),
+    "cannon": ("canyon",),
+    "canyon": ("cannon",),
+    "card": ("car", "cart", "cat", "jar", "hard", "yard"),
+    "hard": ("card", "cart", "yard"),
+    "yard": ("card", "cart", "hard"),
+    "cash": ("case", "cause", "cave", "chase", "crash", "dash", "wash"),
+    "cause": ("case", "cash", "cave", "chase", "pause"),
+    "chase": ("case", "cash", "cause", "cave"),
+    "crash": ("cash", "dash", "wash", "crush", "trash"),
+    "dash": ("cash", "crash", "wash", "dish"),
+    "wash": ("cash", "crash", "dash", "dish"),
+    "castle": ("cattle",),
+    "chat": ("cat", "fat", "hat", "that", "what"),
+    "fat": ("cat", "chat", "hat"),
+    "hat": ("cat", "chat", "fat", "that", "what"),
+    "catch": ("match", "patch"),
+    "match": ("catch", "patch"),
+    "patch": ("catch", "match"),
+    "pause": ("cause",),
+    "have": ("cave", "pave", "save", "wave"),
+    "pave": ("cave", "have", "save", "wave"),
+    "save": ("cave", "have", "pave", "wave"),
+    "wave": ("cave", "have", "pave", "save"),
+    "certain": ("curtain",),
+    "curtain": ("certain",),
+    "chair": ("hair",),
+    "change": ("charge",),
+    "charge": ("change",),
+    "that": ("chat", "hat", "what"),
+    "what": ("chat", "hat", "that"),
+    "chef": ("chief",),
+    "chief": ("chef",),
+    "clap": ("claw", "clay", "clip"),
+    "claw": ("clap", "clay", "clip", "law"),
+    "clay": ("clap", "claw", "clip", "law", "play", "day"),
+    "clip": ("clap", "claw", "clay", "flip"),
+    "law": ("claw", "clay"),
+    "play": ("clay", "day"),
+    "day": ("clay", "play", "dad", "mad", "sad", "dry", "say", "way"),
+    "click": ("clock",),
+    "clock": ("click", "flock", "lock"),
+    "climb": ("limb",),
+    "limb": ("climb",),
+    "flip": ("clip",),
+    "flock": ("clock", "lock"),
+    "lock": ("clock", "flock"),
+    "cloud": ("loud",),
+    "loud": ("cloud",),
+    "clog": ("dog", "fog"),
+    "dog": ("clog", "fog"),
+    "clutch": ("dutch",),
+    "dutch": ("clutch",),
+    "coach": ("couch",),
+    "couch": ("coach", "crouch"),
+    "coast": ("cost", "roast", "toast"),
+    "cost": ("coast", "roast", "toast", "host", "post"),
+    "roast": ("coast", "cost", "toast"),
+    "toast": ("coast", "cost", "roast"),
+    "code": ("come", "core"),
+    "come": ("code", "core", "home"),
+    "core": ("code", "come", "home", "corn", "more"),
+    "coin": ("coil", "cool", "foil", "oil", "corn", "join"),
+    "cool": ("coil", "coin", "foil", "oil", "cook", "pool", "tool", "wool"),
+    "corn": ("coin", "join", "core", "more", "horn"),
+    "join": ("coin", "corn"),
+    "home": ("come", "core"),
+    "pool": ("cool", "tool", "wool"),
+    "tool": ("cool", "pool", "wool"),
+    "wool": ("cool", "pool", "tool"),
+    "coral": ("moral",),
+    "moral": ("coral",),
+    "more": ("core", "corn"),
+    "horn": ("corn",),
+    "host": ("cost", "post"),
+    "post": ("cost", "host"),
+    "crouch": ("couch",),
+    "cover": ("hover", "over"),
+    "hover": ("cover", "over"),
+    "over": ("cover", "hover"),
+    "crack": ("rack", "track"),
+    "rack": ("crack", "track"),
+    "track": ("crack", "rack"),
+    "craft": ("draft",),
+    "draft": ("craft", "drift"),
+    "cram": ("cream",),
+    "cream": ("cram", "dream"),
+    "trash": ("crash", "crush"),
+    "dream": ("cream",),
+    "crop": ("drop",),
+    "drop": ("crop", "drip", "trip"),
+    "cry": ("dry", "try"),
+    "dry": ("cry", "try", "day", "say", "way"),
+    "try": ("cry", "dry"),
+    "cube": ("cute", "tube"),
+    "cute": ("cube", "tube"),
+    "tube": ("cube", "cute"),
+    "mad": ("dad", "day", "sad"),
+    "sad": ("dad", "day", "mad"),
+    "daring": ("during",),
+    "during": ("daring",),
+    "dish": ("dash", "wash", "fish", "wish"),
+    "dawn": ("lawn",),
+    "lawn": ("dawn",),
+    "say": ("day", "dry", "way"),
+    "deal": ("dial", "real"),
+    "dial": ("deal", "real"),
+    "real": ("deal", "dial"),
+    "decade": ("decide",),
+    "decide": ("decade",),
+    "defy": ("deny",),
+    "deny": ("defy",),
+    "derive": ("drive",),
+    "drive": ("derive",),
+    "dice": ("ice", "nice", "rice"),
+    "ice": ("dice", "nice", "rice"),
+    "nice": ("dice", "ice", "rice"),
+    "rice": ("dice", "ice", "nice"),
+    "diet": ("dirt",),
+    "dirt": ("diet",),
+    "dinner": ("inner", "winner"),
+    "inner": ("dinner", "winner"),
+    "winner": ("dinner", "inner"),
+    "fish": ("dish", "wish"),
+    "wish": ("dish", "fish"),
+    "fog": ("dog", "clog"),
+    "donkey": ("monkey",),
+    "monkey": ("donkey",),
+    "donor": ("door",),
+    "door": ("donor", "odor"),
+    "odor": ("door",),
+    "dose": ("dove", "nose", "rose", "close"),
+    "dove": ("dose", "nose", "rose", "close", "love", "move"),
+    "nose": ("dose", "dove", "rose", "close"),
+    "rose": ("dose", "dove", "nose", "close"),
+    "close": ("dose", "dove", "nose", "rose"),
+    "love": ("dove", "move"),
+    "move": ("dove", "love"),
+    "drift": ("draft",),
+    "draw": ("raw",),
+    "raw": ("draw",),
+    "drip": ("drop", "trip"),
+    "trip": ("drip", "drop"),
+    "dust": ("just", "must"),
+    "just": ("dust", "must"),
+    "must": ("dust", "just"),
+    "earn": ("learn",),
+    "learn": ("earn",),
+    "east": ("easy", "vast"),
+    "easy": ("east", "vast"),
+    "vast": ("east", "easy"),
+    "edit": ("exit",),
+    "exit": ("edit",),
+}
+# END GENERATED TREZOR_COMMON_MISTAKES
+
+# Same alternatives as frozensets, for "is X a known mistake for Y?" checks
+# that would otherwise scan the tuples linearly.
+TREZOR_COMMON_MISTAKES_SET: Dict[str, FrozenSet[str]] = {
+    word: frozenset(alternatives)
+    for word, alternatives in TREZOR_COMMON_MISTAKES.items()
+}
+
+# Digits that are easily written down in place of the letter they resemble.
+# BIP39 words never contain digits, so ``word.translate(...)`` can undo these
+# typos in a single pass before the word is looked up in the mappings above.
+TREZOR_CONFUSION_TRANSLATION: Dict[int, str] = str.maketrans({
+    "0": "o",
+    "1": "l",
+    "5": "s",
+})
 
 __all__ = [
     "TREZOR_COMMON_MISTAKE_GROUPS",
     "TREZOR_COMMON_MISTAKES",
+    "TREZOR_COMMON_MISTAKES_SET",
+    "TREZOR_CONFUSION_TRANSLATION",
 ]
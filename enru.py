@@ -1,29 +1,40 @@
 #!/usr/bin/env python3
 
+import functools
 import sys
 
+LAYOUT = {
+    'q': 'й', 'w': 'ц', 'e': 'у', 'r': 'к', 't': 'е', 'y': 'н',
+    'u': 'г', 'i': 'ш', 'o': 'щ', 'p': 'з', '[': 'х', ']': 'ъ',
+    'a': 'ф', 's': 'ы', 'd': 'в', 'f': 'а', 'g': 'п', 'h': 'р',
+    'j': 'о', 'k': 'л', 'l': 'д', ';': 'ж', "'": 'э', 'z': 'я',
+    'x': 'ч', 'c': 'с', 'v': 'м', 'b': 'и', 'n': 'т', 'm': 'ь',
+    ',': 'б', '.': 'ю', '/': '.', '<': 'Б', '>': 'Ю', '?': ',',
+    'Q': 'Й', 'W': 'Ц', 'E': 'У', 'R': 'К', 'T': 'Е', 'Y': 'Н',
+    'U': 'Г', 'I': 'Ш', 'O': 'Щ', 'P': 'З', '{': 'Х', '}': 'Ъ',
+    'A': 'Ф', 'S': 'Ы', 'D': 'В', 'F': 'А', 'G': 'П', 'H': 'Р',
+    'J': 'О', 'K': 'Л', 'L': 'Д', ':': 'Ж', '"': 'Э', 'Z': 'Я',
+    'X': 'Ч', 'C': 'С', 'V': 'М', 'B': 'И', 'N': 'Т', 'M': 'Ь'
+}
+
+# Built once so convert_layout is a single C-level pass over the string
+TRANSLATION = str.maketrans(LAYOUT)
+
+# Word and password lists repeat the same entries a lot, so remember recent
+# conversions
+@functools.lru_cache(maxsize=1 << 16)
 def convert_layout(text):
-    layout = {
-        'q': 'й', 'w': 'ц', 'e': 'у', 'r': 'к', 't': 'е', 'y': 'н',
-        'u': 'г', 'i': 'ш', 'o': 'щ', 'p': 'з', '[': 'х', ']': 'ъ',
-        'a': 'ф', 's': 'ы', 'd': 'в', 'f': 'а', 'g': 'п', 'h': 'р',
-        'j': 'о', 'k': 'л', 'l': 'д', ';': 'ж', "'": 'э', 'z': 'я',
-        'x': 'ч', 'c': 'с', 'v': 'м', 'b': 'и', 'n': 'т', 'm': 'ь',
-        ',': 'б', '.': 'ю', '/': '.', '<': 'Б', '>': 'Ю', '?': ',',
-        'Q': 'Й', 'W': 'Ц', 'E': 'У', 'R': 'К', 'T': 'Е', 'Y': 'Н',
-        'U': 'Г', 'I': 'Ш', 'O': 'Щ', 'P': 'З', '{': 'Х', '}': 'Ъ',
-        'A': 'Ф', 'S': 'Ы', 'D': 'В', 'F': 'А', 'G': 'П', 'H': 'Р',
-        'J': 'О', 'K': 'Л', 'L': 'Д', ':': 'Ж', '"': 'Э', 'Z': 'Я',
-        'X': 'Ч', 'C': 'С', 'V': 'М', 'B': 'И', 'N': 'Т', 'M': 'Ь'
-    }
-    
-    return ''.join(layout.get(ch, ch) for ch in text)
+    return text.translate(TRANSLATION)
 
 if __name__ == "__main__":
     if len(sys.argv) != 2:
         print("Usage: python enru.py <pwd.txt>")
         sys.exit(1)
     
+    # Translate and write roughly a megabyte of lines at a time rather than
+    # calling print() per line; memory stays bounded for huge wordlists.
+    # The chunks are never repeated, so they bypass convert_layout's cache.
+    write = sys.stdout.write
     with open(sys.argv[1], 'r') as f:
-        for line in f:
-            print(convert_layout(line.strip()))
\ No newline at end of file
+        for lines in iter(lambda: f.readlines(1 << 20), []):
+            write(''.join(line.strip() + '\n' for line in lines).translate(TRANSLATION))
@@ -16,73 +16,144 @@
 
 __version__ = '2.0.0-git'
 
-# Prefer wallycore for scrypt as it performs about 20% faster than
-# the pylibscrypt backend. If unavailable we fall back to pylibscrypt
-# (via hashlib or libsodium as needed).
-_done = False
-try:
-    import wallycore as _wallycore
-    from . import mcf as mcf_mod
-    from .common import (
-        SCRYPT_N, SCRYPT_r, SCRYPT_p, SCRYPT_MCF_PREFIX_DEFAULT, check_args)
-
-    def scrypt(password, salt, N=SCRYPT_N, r=SCRYPT_r, p=SCRYPT_p, olen=64):
-        check_args(password, salt, N, r, p, olen)
-        out = bytearray(olen)
-        _wallycore.scrypt(password, salt, N, r, p, out)
-        return bytes(out)
-
-    def scrypt_mcf(password, salt=None, N=SCRYPT_N, r=SCRYPT_r, p=SCRYPT_p,
-                   prefix=SCRYPT_MCF_PREFIX_DEFAULT):
-        return mcf_mod.scrypt_mcf(scrypt, password, salt, N, r, p, prefix)
-
-    def scrypt_mcf_check(mcf, password):
-        return mcf_mod.scrypt_mcf_check(scrypt, mcf, password)
-except ImportError:
-    pass
-else:
-    _done = True
-
-# First, try hashlib if wallycore isn't available
-if not _done:
+import importlib
+import os
+import sys
+
+from .common import SCRYPT_N, SCRYPT_r, SCRYPT_p
+
+# Backends in order of preference. A locally built SIMD crypto_scrypt (see
+# scrypt_simd.py) comes first, then wallycore, which performs about 20% faster
+# than the pylibscrypt backend, then hashlib, the system libraries and finally
+# the inlined Python version, which always imports.
+_BACKENDS = (
+    'scrypt_simd', 'wallyscrypt', 'hashlibscrypt', 'pylibscrypt', 'pyscrypt',
+    'pylibsodium', 'pypyscrypt_inline',
+)
+_FALLBACK = 'pypyscrypt_inline'
+
+
+# Backends that are found by a ctypes library search (which may run ldconfig)
+# rather than by a plain Python import.
+_LIBRARY_BACKENDS = frozenset(('scrypt_simd', 'pylibscrypt', 'pylibsodium'))
+_LD_SO_CACHE = '/etc/ld.so.cache'
+
+
+# Probing means up to six failed imports and library searches on every start,
+# so the winner is remembered per interpreter in the user's cache dir. Set
+# PYLIBSCRYPT_NO_CACHE to always probe.
+#
+# A remembered winner must not hide a faster backend installed later. The
+# import-only backends ranked above it are cheap to try, so they are always
+# probed again. Library searches are only skipped while the key still matches,
+# and the key includes the dynamic linker cache and search paths, which
+# change when a library is installed. The pure-Python fallback is never
+# remembered.
+def _cache_file():
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'btcrecover', 'scrypt_backend')
+
+
+def _library_fingerprint():
+    """Returns something that changes when a new shared library is installed,
+    or None where that cannot be detected cheaply"""
     try:
-        from .hashlibscrypt import *
-    except ImportError:
-        pass
-    else:
-        _done = True
+        mtime = os.stat(_LD_SO_CACHE).st_mtime_ns
+    except OSError:
+        return None
+    return '%d:%s' % (mtime, os.environ.get('LD_LIBRARY_PATH', ''))
+
 
-# If that didn't work, try loading libscrypt
-if not _done:
+def _cache_key():
+    return '%s|%s|%s|%s' % (sys.version.split()[0], sys.executable,
+                            os.environ.get('PYLIBSCRYPT_SIMD_LIB', ''),
+                            _library_fingerprint())
+
+
+def _read_cached_backend():
     try:
-        from .pylibscrypt import *
-    except ImportError:
-        pass
-    else:
-        _done = True
+        with open(_cache_file()) as f:
+            key, name = f.read().split('\n')[:2]
+    except (OSError, ValueError):
+        return None
+    return name if key == _cache_key() else None
+
 
-# Next: try the scrypt module
-if not _done:
+def _write_cached_backend(name):
+    path = _cache_file()
     try:
-        from .pyscrypt import *
-    except ImportError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            f.write(_cache_key() + '\n' + name + '\n')
+    except OSError:
         pass
-    else:
-        _done = True
 
-# Next: libsodium
-if not _done:
+
+def _import_backend(name):
     try:
-        from .pylibsodium import *
+        return importlib.import_module('.' + name, __name__)
     except ImportError:
-        pass
+        return None
+
+
+def _load_backend():
+    use_cache = not os.environ.get('PYLIBSCRYPT_NO_CACHE')
+    cached = _read_cached_backend() if use_cache else None
+    if cached in _BACKENDS and cached != _FALLBACK:
+        # Library searches above the cached winner are trusted to still fail
+        # while the key matches, unless library installs cannot be detected
+        skip = _LIBRARY_BACKENDS if _library_fingerprint() is not None else ()
+        candidates = [name for name in _BACKENDS[:_BACKENDS.index(cached) + 1]
+                      if name not in skip or name == cached]
     else:
-        _done = True
+        candidates = _BACKENDS
+
+    for name in candidates:
+        module = _import_backend(name)
+        if module is not None:
+            break
+    else:
+        # The cached backend no longer imports; probe everything below it too
+        for name in _BACKENDS:
+            module = _import_backend(name)
+            if module is not None:
+                break
+
+    if use_cache and name != cached and name != _FALLBACK:
+        _write_cached_backend(name)
+    return name, module
+
+
+_backend_name, _backend = _load_backend()
+scrypt = _backend.scrypt
+scrypt_mcf = _backend.scrypt_mcf
+scrypt_mcf_check = _backend.scrypt_mcf_check
+
+# True iff a native (non pure-Python) implementation was found
+_done = _backend_name != _FALLBACK
+
+
+def scrypt_many(passwords, salt, N=SCRYPT_N, r=SCRYPT_r, p=SCRYPT_p, olen=64,
+                max_workers=None):
+    """Returns scrypt(password, salt, N, r, p, olen) for each password, in order
 
-# If that didn't work either, the inlined Python version
-if not _done:
-    from .pypyscrypt_inline import *
+    The native backends release the GIL while hashing, so the passwords are
+    spread over a thread pool of max_workers threads (default: one per CPU).
+    With the pure-Python fallback threads cannot help and the passwords are
+    hashed one after another.
+    """
+    passwords = list(passwords)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(passwords))
+    if not _done or max_workers <= 1:
+        return [scrypt(password, salt, N, r, p, olen) for password in passwords]
 
-__all__ = ['scrypt', 'scrypt_mcf', 'scrypt_mcf_check']
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda password: scrypt(password, salt, N, r, p, olen), passwords))
 
 
+__all__ = ['scrypt', 'scrypt_many', 'scrypt_mcf', 'scrypt_mcf_check']
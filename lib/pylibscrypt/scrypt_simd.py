@@ -0,0 +1,106 @@
+# Copyright (c) 2014-2019, Jan Varho
+#
+# Permission to use, copy, modify, and/or distribute this software for any
+# purpose with or without fee is hereby granted, provided that the above
+# copyright notice and this permission notice appear in all copies.
+#
+# THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES
+# WITH REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF
+# MERCHANTABILITY AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR
+# ANY SPECIAL, DIRECT, INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES
+# WHATSOEVER RESULTING FROM LOSS OF USE, DATA OR PROFITS, WHETHER IN AN
+# ACTION OF CONTRACT, NEGLIGENCE OR OTHER TORTIOUS ACTION, ARISING OUT OF
+# OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
+
+"""Scrypt implementation that calls a SIMD build of Tarsnap's crypto_scrypt
+
+The library is not shipped; build the reference scrypt sources with their
+SSE2/AVX2 Salsa20/8 core (e.g. ``-O3 -mavx2``) as a shared library exporting
+``crypto_scrypt`` and point ``PYLIBSCRYPT_SIMD_LIB`` at it, or install it
+where ``ctypes.util.find_library('scrypt_simd')`` can find it.
+"""
+
+
+import ctypes
+from ctypes import c_char_p, c_size_t, c_uint64, c_uint32
+from ctypes.util import find_library
+import os
+
+from . import mcf as mcf_mod
+from .common import (
+    SCRYPT_N, SCRYPT_r, SCRYPT_p, SCRYPT_MCF_PREFIX_DEFAULT, check_args)
+
+
+_simd_soname = os.environ.get('PYLIBSCRYPT_SIMD_LIB') or find_library('scrypt_simd')
+if not _simd_soname:
+    raise ImportError('Unable to find a SIMD scrypt library')
+
+try:
+    _simd = ctypes.CDLL(_simd_soname)
+    _crypto_scrypt = _simd.crypto_scrypt
+except OSError:
+    raise ImportError('Unable to load SIMD scrypt library: ' + _simd_soname)
+except AttributeError:
+    raise ImportError('Incompatible SIMD scrypt library: ' + _simd_soname)
+
+_crypto_scrypt.argtypes = [
+    c_char_p,  # password
+    c_size_t,  # password length
+    c_char_p,  # salt
+    c_size_t,  # salt length
+    c_uint64,  # N
+    c_uint32,  # r
+    c_uint32,  # p
+    c_char_p,  # out
+    c_size_t,  # out length
+]
+
+
+def scrypt(password, salt, N=SCRYPT_N, r=SCRYPT_r, p=SCRYPT_p, olen=64):
+    """Returns a key derived using the scrypt key-derivarion function
+
+    N must be a power of two larger than 1 but no larger than 2 ** 63 (insane)
+    r and p must be positive numbers such that r * p < 2 ** 30
+
+    The default values are:
+    N -- 2**14 (~16k)
+    r -- 8
+    p -- 1
+
+    Memory usage is proportional to N*r. Defaults require about 16 MiB.
+    Time taken is proportional to N*p. Defaults take <100ms of a recent x86.
+    """
+    check_args(password, salt, N, r, p, olen)
+
+    out = ctypes.create_string_buffer(olen)
+    ret = _crypto_scrypt(password, len(password), salt, len(salt),
+                         N, r, p, out, olen)
+    if ret:
+        raise ValueError
+
+    return out.raw
+
+
+def scrypt_mcf(password, salt=None, N=SCRYPT_N, r=SCRYPT_r, p=SCRYPT_p,
+               prefix=SCRYPT_MCF_PREFIX_DEFAULT):
+    """Derives a Modular Crypt Format hash using the scrypt KDF
+
+    Parameter space is smaller than for scrypt():
+    N must be a power of two larger than 1 but no larger than 2 ** 31
+    r and p must be positive numbers between 1 and 255
+    Salt must be a byte string 1-16 bytes long.
+
+    If no salt is given, a random salt of 128+ bits is used. (Recommended.)
+    """
+    return mcf_mod.scrypt_mcf(scrypt, password, salt, N, r, p, prefix)
+
+
+def scrypt_mcf_check(mcf, password):
+    """Returns True if the password matches the given MCF hash"""
+    return mcf_mod.scrypt_mcf_check(scrypt, mcf, password)
+
+
+if __name__ == "__main__":
+    import sys
+    from . import tests
+    tests.run_scrypt_suite(sys.modules[__name__])
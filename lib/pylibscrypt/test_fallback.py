@@ -16,9 +16,13 @@
 
 import ctypes.util
 import hashlib
+import os
 import platform
 import sys
 
+# Always probe, and never record the deliberately crippled backends below
+os.environ['PYLIBSCRYPT_NO_CACHE'] = '1'
+
 if '-p' in sys.argv:
     platform.python_implementation = lambda:'PyPy'
 
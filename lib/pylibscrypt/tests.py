@@ -374,6 +374,27 @@ class ScryptTests(unittest.TestCase):
         self.assertTrue(self.module.scrypt_mcf_check(m2, pw))
 
 
+class ScryptManyTests(unittest.TestCase):
+    """Tests the batched scrypt_many entry point"""
+
+    def test_matches_scrypt(self):
+        from . import scrypt, scrypt_many
+        passwords = [b'password', b'', b'\x00\xff', b'pass' * 20]
+        expected = [scrypt(pw, b'NaCl', 16, 1, 1, 32) for pw in passwords]
+        for workers in (None, 1, 3):
+            self.assertEqual(
+                scrypt_many(passwords, b'NaCl', 16, 1, 1, 32, max_workers=workers),
+                expected)
+
+    def test_empty(self):
+        from . import scrypt_many
+        self.assertEqual(scrypt_many([], b'NaCl', 16, 1, 1), [])
+
+    def test_bad_args(self):
+        from . import scrypt_many
+        self.assertRaises(ValueError, scrypt_many, [b'pw', b'pw2'], b'NaCl', 3)
+
+
 def load_scrypt_suite(name, module, fast=True):
     tests = type(name, (ScryptTests,), {'module': module, 'fast': fast})
     return unittest.defaultTestLoader.loadTestsFromTestCase(tests)
@@ -387,6 +408,12 @@ def run_scrypt_suite(module, fast=False):
 
 if __name__ == "__main__":
     suite = unittest.TestSuite()
+    try:
+        from . import scrypt_simd
+        suite.addTest(load_scrypt_suite('scrypt_simdTests', scrypt_simd, True))
+    except ImportError:
+        suite.addTest(load_scrypt_suite('scrypt_simdTests', None, True))
+
     try:
         from . import hashlibscrypt
         suite.addTest(load_scrypt_suite('hashlibscryptTests', hashlibscrypt, True))
@@ -440,6 +467,9 @@ if __name__ == "__main__":
     except ImportError:
         suite.addTest(load_scrypt_suite('pypyscryptTests', None, True))
 
+    suite.addTest(
+        unittest.defaultTestLoader.loadTestsFromTestCase(ScryptManyTests))
+
     result = unittest.TextTestRunner().run(suite)
     sys.exit(not result.wasSuccessful())
 
@@ -27,6 +27,7 @@
 
 
 import compatibility_check
+import py_compile
 
 # Use the green test runner if available
 try:
@@ -52,19 +53,78 @@ except ImportError:
     has_green = False
 
 
+class _CountOnly:
+    """Stands in for a list of test results where only its length is used."""
+
+    __slots__ = ("count",)
+
+    def __init__(self, count):
+        self.count = count
+
+    def __len__(self):
+        return self.count
+
+
+def compile_script(path):
+    """Byte-compile *path*, returning the error message rather than raising it.
+
+    Runs in a worker process; ``PyCompileError`` cannot be unpickled, so the
+    failure is reported back as a string.
+    """
+    try:
+        py_compile.compile(path, doraise=True)
+    except py_compile.PyCompileError as exc:
+        return exc.msg
+    return None
+
+
+def _load_fork_server():
+    """Load btcrecover/test/_fork_server.py without importing btcrecover."""
+    import importlib.util, os
+
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "btcrecover", "test", "_fork_server.py")
+    spec = importlib.util.spec_from_file_location("_fork_server", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _run_script(request):
+    """Run one script in a child forked by :func:`script_worker`."""
+    import os, runpy, sys
+
+    sys.argv = [request["path"], *request["argv"]]
+    sys.path[0] = os.path.dirname(request["path"])
+    os.chdir(request["cwd"])
+    runpy.run_path(request["path"], run_name="__main__")
+
+
+def script_worker():
+    """Serve script runs until stdin closes.
+
+    Each request carries the script's ``path``, ``argv`` and ``cwd``; the
+    script runs in a child forked from this already started interpreter.
+    """
+    _load_fork_server().serve(_run_script)
+
+
 if __name__ == "__main__":
     import argparse
     import atexit
     import multiprocessing
     import os
-    import py_compile
     import subprocess
     import sys
     import time
     import timeit
     import tempfile
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
     from pathlib import Path
 
+    if sys.argv[1:] == ["--script-worker"]:
+        script_worker()
+        sys.exit(0)
+
     from btcrecover.test import test_passwords
 
     is_coincurve_loadable = test_passwords.can_load_coincurve()
@@ -78,6 +138,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(add_help=False)
     parser.add_argument("--no-buffer", action="store_true")
     parser.add_argument("--no-pause",  action="store_true")
+    parser.add_argument("--skip-verify", action="store_true")
     args, unparsed_args = parser.parse_known_args()
     sys.argv[1:] = unparsed_args
 
@@ -96,16 +157,20 @@ if __name__ == "__main__":
             repo_root / "extract-scripts",
         )
 
-        scripts = sorted(
-            script
-            for directory in script_dirs
-            if directory.exists()
-            for script in directory.iterdir()
-            if script.is_file() and script.suffix == ".py"
-        )
-
+        # scandir's entries carry the file type from the directory listing,
+        # so filtering needs no per-file stat() on most platforms
         this_file = Path(__file__).resolve()
-        scripts = [script for script in scripts if script != this_file]
+        scripts = []
+        for directory in script_dirs:
+            if not directory.exists():
+                continue
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".py") and entry.is_file():
+                        script = Path(entry.path)
+                        if script != this_file:
+                            scripts.append(script)
+        scripts.sort()
 
         env = os.environ.copy()
         pythonpath = env.get("PYTHONPATH")
@@ -117,17 +182,22 @@ if __name__ == "__main__":
         temp_files = []
 
         try:
-            for script in scripts:
-                py_compile.compile(str(script), doraise=True)
+            # Each compile is independent and CPU bound, so spread them over
+            # all cores
+            with ProcessPoolExecutor() as executor:
+                compile_errors = list(executor.map(compile_script, map(str, scripts)))
+            for error in compile_errors:
+                if error is not None:
+                    raise RuntimeError(error)
 
             acceptable_return_codes = {0, 2}
+            help_flags = ("--help", "-h", None)
 
             extra_args = {}
             skip_execution = {
                 repo_root / "test_opencl_brute.py",
                 repo_root / "utilities" / "generate_batch_seed_variations.py",
             }
-
             batch_script = repo_root / "seedrecover_batch.py"
             if batch_script in scripts:
                 temp_batch = tempfile.NamedTemporaryFile(
@@ -138,35 +208,55 @@ if __name__ == "__main__":
                 temp_files.append(Path(temp_batch.name))
                 extra_args[batch_script] = ("--batch-file", temp_batch.name)
 
-            for script in scripts:
-                if script in skip_execution:
-                    continue
+            def script_args(script, flag):
+                return ([flag] if flag is not None else []) + list(extra_args.get(script, ()))
 
-                help_flags = ("--help", "-h", None)
-                last_result = None
-                executed_successfully = False
+            script_server = None
 
+            def run_in_subprocess(script):
+                last_result = None
                 for flag in help_flags:
-                    command = [sys.executable, str(script)]
-                    if flag is not None:
-                        command.append(flag)
+                    if script_server is not None:
+                        last_result = script_server.run(
+                            [sys.executable, str(script)] + script_args(script, flag),
+                            {"path": str(script), "argv": script_args(script, flag), "cwd": str(repo_root)},
+                        )
+                    else:
+                        last_result = subprocess.run(
+                            [sys.executable, str(script)] + script_args(script, flag),
+                            cwd=str(repo_root),
+                            env=env,
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE,
+                            text=True,
+                        )
+                    if last_result.returncode in acceptable_return_codes:
+                        break
+                return last_result
 
-                    if script in extra_args:
-                        command.extend(extra_args[script])
+            # Every script gets a process of its own: running one here would
+            # leave module state behind (btcrecover.py --help half configures
+            # btcrpass, for one) that breaks the unit tests run afterwards
+            needs_subprocess = [script for script in scripts if script not in skip_execution]
 
-                    last_result = subprocess.run(
-                        command,
-                        cwd=str(repo_root),
-                        env=env,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                    )
+            jobs = min(os.cpu_count() or 1, len(needs_subprocess)) or 1
+            if hasattr(os, "fork") and needs_subprocess:
+                # One fork server runs the scripts in parallel children, each
+                # without paying interpreter start-up
+                script_server = _load_fork_server().Client(
+                    [sys.executable, __file__, "--script-worker"], str(repo_root), env
+                )
+                if not script_server.ready:
+                    script_server = None
+            try:
+                with ThreadPoolExecutor(max_workers=jobs) as executor:
+                    subprocess_results = list(zip(needs_subprocess, executor.map(run_in_subprocess, needs_subprocess)))
+            finally:
+                if script_server is not None:
+                    script_server.close()
 
-                    if last_result.returncode in acceptable_return_codes:
-                        executed_successfully = True
-                        break
-                if executed_successfully:
+            for script, last_result in subprocess_results:
+                if last_result is not None and last_result.returncode in acceptable_return_codes:
                     continue
 
                 stdout = last_result.stdout if last_result else ""
@@ -199,14 +289,19 @@ if __name__ == "__main__":
 
     print("Testing", full_version() + "\n")
 
-    print("Verifying Python scripts for syntax and basic execution...\n")
+    # Script verification is on by default; skip it with --skip-verify or
+    # BTCR_SKIP_VERIFY=1 when only running a subset of the tests
+    if args.skip_verify or os.environ.get("BTCR_SKIP_VERIFY", "0") not in ("", "0"):
+        print("Skipping Python script verification\n")
+    else:
+        print("Verifying Python scripts for syntax and basic execution...\n")
 
-    try:
-        verify_python_scripts()
-    except Exception as exc:
-        print("Script verification failed:", file=sys.stderr)
-        print(exc, file=sys.stderr)
-        sys.exit(1)
+        try:
+            verify_python_scripts()
+        except Exception as exc:
+            print("Script verification failed:", file=sys.stderr)
+            print(exc, file=sys.stderr)
+            sys.exit(1)
 
     # Additional setup normally done by green.cmdline.main()
     if has_green:
@@ -250,10 +345,10 @@ if __name__ == "__main__":
         # Print the results in color using green
         results.startTime  = start_time
         results.testsRun   = total_tests
-        results.passing    = (None,) * total_passing
-        results.skipped    = (None,) * total_skipped
-        results.failures   = (None,) * total_failures
-        results.errors     = (None,) * total_errors
+        results.passing    = _CountOnly(total_passing)
+        results.skipped    = _CountOnly(total_skipped)
+        results.failures   = _CountOnly(total_failures)
+        results.errors     = _CountOnly(total_errors)
         results.all_errors = ()
         green_args.no_skip_report = True
         results.stopTestRun()
@@ -39,12 +39,14 @@ def _start_success_beep_if_needed():
 def _stop_success_beep():
     success_alert.stop_success_beep()
 
-if __name__ == "__main__":
+
+def main(argv):
+    """Run a seed recovery with *argv* and return the process exit code."""
     print()
     print("Starting", btcrseed.full_version())
 
     btcrseed.register_autodetecting_wallets()
-    mnemonic_sentence, path_coin = btcrseed.main(sys.argv[1:])
+    mnemonic_sentence, path_coin = btcrseed.main(argv)
 
     if mnemonic_sentence:
         _start_success_beep_if_needed()
@@ -111,4 +113,8 @@ if __name__ == "__main__":
 
     _stop_success_beep()
 
-    sys.exit(retval)
+    return retval
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -27,9 +27,16 @@
 
 import argparse
 import datetime
+import functools
+import hashlib
+import mmap
 import os
 import shlex
-import compatibility_check, copy
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+import compatibility_check
 
 from btcrecover import btcrseed
 from btcrecover import success_alert
@@ -45,6 +52,12 @@ def _parse_batch_arguments(argv):
         metavar="ID(/ID2,...)/TOTAL",
         help="split batch processing across workers, similar to seedrecover --worker",
     )
+    parser.add_argument(
+        "--batch-worker-hash",
+        action="store_true",
+        help="assign seeds to --batch-worker shards by a hash of the seed instead of its position "
+             "in the batch file; every worker must use the same setting",
+    )
     parser.add_argument(
         "--batch-file",
         default="batch_seeds.txt",
@@ -76,6 +89,14 @@ def _parse_batch_arguments(argv):
         action="store_true",
         help="include command arguments in progress log entries",
     )
+    parser.add_argument(
+        "--batch-jobs",
+        type=int,
+        default=1,
+        metavar="COUNT",
+        help="run up to COUNT seeds at once in separate processes (default: %(default)s); "
+             "the seedrecover options must not require any interactive input",
+    )
 
     parsed_args, remaining = parser.parse_known_args(argv[1:])
     sys.argv = [argv[0]] + remaining
@@ -87,6 +108,9 @@ def _parse_batch_arguments(argv):
     if os.path.abspath(progress_filename) == os.path.abspath(parsed_args.batch_file):
         parser.error("progress file cannot be the same as the batch file")
 
+    if parsed_args.batch_jobs < 1:
+        parser.error("--batch-jobs must be >= 1")
+
     if parsed_args.batch_worker:
         try:
             worker_part, total_part = parsed_args.batch_worker.split("/")
@@ -116,104 +140,406 @@ def _parse_batch_arguments(argv):
         parsed_args.batch_skip_completed,
         parsed_args.batch_progress_include_timestamp,
         parsed_args.batch_progress_include_arguments,
+        parsed_args.batch_jobs,
+        parsed_args.batch_worker_hash,
     )
 
 
-def _load_completed_seeds(progress_filename):
-    completed_status = {}
-    if not progress_filename:
-        return set()
+# Completed seeds are only needed for membership tests, so a 64-bit hash of
+# each one is kept instead of the full mnemonic, a fraction of the memory for
+# progress files with millions of entries.  Python's string hash is only stable
+# within one process, which is all these sets live for.  Where hashes are just
+# 32 bits collisions would be too likely, so the seeds themselves are kept.
+_seed_key = hash if sys.hash_info.width >= 64 else str
 
-    success_statuses = {"MATCHED", "CHECKED"}
 
-    try:
-        with open(progress_filename, "r", encoding="utf-8") as progress_file:
-            for line in progress_file:
-                parts = line.rstrip("\n").split("\t")
-                if len(parts) < 2:
-                    continue
+class _CompletedSeeds:
+    """Set-like collection of completed seeds, stored by :data:`_seed_key`."""
+
+    __slots__ = ("_keys",)
+
+    def __init__(self, keys=()):
+        self._keys = set(keys)
 
-                status, seed_value = parts[0], parts[1]
-                if not seed_value:
-                    continue
+    def __contains__(self, seed):
+        return _seed_key(seed) in self._keys
 
-                previous_status = completed_status.get(seed_value)
+    def __len__(self):
+        return len(self._keys)
 
-                if previous_status in success_statuses:
-                    continue
+    def add(self, seed):
+        self._keys.add(_seed_key(seed))
 
-                if status in success_statuses or previous_status is None:
-                    completed_status[seed_value] = status
+
+@functools.lru_cache(maxsize=8)
+def _read_completed_seeds(progress_filename, mtime_ns, size):
+    """Return the keys of the seeds marked MATCHED or CHECKED in the progress file.
+
+    Both statuses are final, so a seed counts as completed as soon as any
+    line gives it one of them.  *mtime_ns* and *size* only key the cache, so
+    an unchanged file is not parsed twice.
+    """
+    success_statuses = ("MATCHED", "CHECKED")
+    completed = set()
+    with open(progress_filename, "r", encoding="utf-8") as progress_file:
+        for line in progress_file:
+            parts = line.rstrip("\n").split("\t", 2)
+            if len(parts) >= 2 and parts[0] in success_statuses and parts[1]:
+                completed.add(_seed_key(parts[1]))
+    return frozenset(completed)
+
+
+def _load_completed_seeds(progress_filename):
+    if not progress_filename:
+        return _CompletedSeeds()
+
+    try:
+        stat = os.stat(progress_filename)
+        completed = _read_completed_seeds(
+            os.path.abspath(progress_filename), stat.st_mtime_ns, stat.st_size
+        )
     except FileNotFoundError:
-        return set()
+        return _CompletedSeeds()
     except OSError as exc:  # pragma: no cover - defensive programming
         print(
             f"Unable to read progress file '{progress_filename}' to skip completed seeds: {exc}",
             file=sys.stderr,
         )
+        return _CompletedSeeds()
+
+    # The caller adds seeds as they complete, so hand out a mutable copy
+    return _CompletedSeeds(completed)
 
-    return {
-        seed
-        for seed, status in completed_status.items()
-        if status in success_statuses
-    }
 
+def _progress_contains_match(progress_filename, offset=0):
+    """Check the progress file for a MATCHED entry past byte *offset*.
 
-def _progress_contains_match(progress_filename):
+    Returns ``(matched, offset)`` where the new offset is the end of the last
+    complete line read, so the next call only looks at lines appended since
+    (by this process or by other workers sharing the file).  The new bytes
+    are memory mapped and searched in one pass rather than read line by line,
+    which keeps the first check of a large, existing progress file fast.
+    """
     if not progress_filename:
-        return False
+        return False, offset
 
     try:
-        with open(progress_filename, "r", encoding="utf-8") as progress_file:
-            for line in progress_file:
-                if line.startswith("MATCHED\t"):
-                    return True
+        with open(progress_filename, "rb") as progress_file:
+            size = os.fstat(progress_file.fileno()).st_size
+            if size < offset:
+                offset = 0  # the file was truncated or replaced; start over
+            if size == offset:
+                return False, offset
+            with mmap.mmap(progress_file.fileno(), size, access=mmap.ACCESS_READ) as progress_map:
+                # A trailing partial line may still be being written by another
+                # worker; leave it to be re-read next time
+                end = progress_map.rfind(b"\n", offset) + 1
+                if not end:
+                    return False, offset
+                # offset always sits at the start of a line
+                if (
+                    progress_map[offset:offset + 8] == b"MATCHED\t"
+                    or progress_map.find(b"\nMATCHED\t", offset, end) != -1
+                ):
+                    return True, end
+                return False, end
     except FileNotFoundError:
-        return False
+        return False, 0
     except OSError as exc:  # pragma: no cover - defensive programming
         print(
             f"Unable to read progress file '{progress_filename}' while checking for matches: {exc}",
             file=sys.stderr,
         )
 
-    return False
+    return False, offset
 
 
-def _append_progress(
-    progress_filename,
-    seed,
-    status,
-    include_timestamp=False,
-    arguments=None,
-):
-    if not progress_filename:
+def _seed_shard(seed, workers_total):
+    """Return the worker shard for *seed* based on a stable hash of its text."""
+    digest = hashlib.blake2s(seed.encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "big") % workers_total
+
+
+def _batch_work_list(batch_lines, worker_ids, workers_total, completed_seeds, shard_by_hash=False):
+    """Return the seeds from the batch file that this worker still has to try.
+
+    *batch_lines* may be any iterable of lines, such as the open batch file.
+    Blank lines and comments are dropped and trailing comments stripped.  A
+    seed's worker shard is its position among all parsed seeds, so completed
+    seeds still count towards the sharding.  With *shard_by_hash* the shard
+    comes from :func:`_seed_shard` instead, which spreads runs of similar
+    seeds across the workers and does not depend on the file's order.
+    """
+    # Whatever precedes a "#" is the seed, so blank and comment lines parse as ""
+    seeds = (seed for seed in (line.split("#", 1)[0].strip() for line in batch_lines) if seed)
+
+    if worker_ids is not None:
+        worker_ids = frozenset(worker_ids)
+        if shard_by_hash:
+            seeds = (seed for seed in seeds if _seed_shard(seed, workers_total) in worker_ids)
+        else:
+            seeds = (seed for index, seed in enumerate(seeds) if index % workers_total in worker_ids)
+
+    remaining = []
+    for seed in seeds:
+        if seed in completed_seeds:
+            print("Skipping Seed (already completed):", seed)
+        else:
+            remaining.append(seed)
+
+    return remaining
+
+
+class _PendingSeeds:
+    """Iterates over ``(seed, seed_argv)`` for the seeds still to be run.
+
+    Before each seed is started the progress file is checked, so the batch
+    stops as soon as any worker has recorded a match.
+    """
+
+    def __init__(self, batch_seeds, base_argv, progress_filename, skip_completed, completed_seeds):
+        self.batch_seeds = batch_seeds
+        # Strings are immutable, so each seed only needs a fresh list around these
+        self.base_argv = tuple(base_argv)
+        self.progress_filename = progress_filename
+        self.skip_completed = skip_completed
+        self.completed_seeds = completed_seeds
+        self.match_recorded = False
+
+    def __iter__(self):
+        progress_offset = 0
+        for seed_to_try in self.batch_seeds:
+            # A seed repeated in the batch file may have been completed earlier
+            # in this run; checked first as it needs no file access
+            if self.skip_completed and seed_to_try in self.completed_seeds:
+                print("Skipping Seed (already completed):", seed_to_try)
+                continue
+
+            # Only the lines appended since the previous check are read
+            progress_matched, progress_offset = _progress_contains_match(self.progress_filename, progress_offset)
+            if progress_matched:
+                print("Stopping: matched seed already recorded in progress file")
+                self.match_recorded = True
+                return
+
+            print("Running Seed:", seed_to_try)
+            yield seed_to_try, [*self.base_argv, "--mnemonic", seed_to_try]
+
+
+def _limit_threads(argv, jobs):
+    """Split the CPU threads between the parallel seeds unless --threads was given."""
+    if jobs == 1:
+        return argv
+    # Parse with btcrseed's own parser so abbreviations such as --thr count too
+    args, _ = btcrseed.build_parser().parse_known_args(argv)
+    if args.threads is not None:
+        return argv
+    return [*argv, "--threads", str(max(1, (os.cpu_count() or 1) // jobs))]
+
+
+def _run_seed(seed_argv):
+    """Run btcrseed for one seed, returning its result or ``None`` if it raised."""
+    try:
+        return btcrseed.main(seed_argv)
+    except Exception:  # pragma: no cover - btcrseed failures are environment dependent
+        return None
+
+
+def _stop_worker(signum, frame):
+    # btcrseed runs its search in a pool of its own; take those processes
+    # down with this one instead of leaving them orphaned
+    for process in multiprocessing.active_children():
+        process.kill()
+    os._exit(1)
+
+
+def _init_worker():
+    # btcrpass points SIGTERM at whatever handles SIGINT while it searches,
+    # so both have to stop the worker for terminate() to keep working
+    signal.signal(signal.SIGINT, _stop_worker)
+    signal.signal(signal.SIGTERM, _stop_worker)
+    # Runs once per worker process rather than once per seed; workers started
+    # with "spawn" import btcrseed afresh and have nothing registered yet
+    btcrseed.register_autodetecting_wallets()
+
+
+def _worker_context():
+    """Return the multiprocessing context for the batch worker pool.
+
+    Forked workers inherit the modules the batch has already imported.  Windows
+    cannot fork, and forking is unsafe with the macOS system frameworks, so
+    those platforms spawn fresh interpreters.
+    """
+    if sys.platform in ("win32", "darwin"):
+        return multiprocessing.get_context("spawn")
+    return multiprocessing.get_context("fork")
+
+
+def _worker_pool(jobs):
+    # Pool workers must not be daemonic, as btcrseed starts its own pool
+    return ProcessPoolExecutor(max_workers=jobs, mp_context=_worker_context(), initializer=_init_worker)
+
+
+def _stop_workers(timeout=5.0):
+    """Terminate the worker processes, killing any that do not exit in time."""
+    workers = multiprocessing.active_children()
+    for process in workers:
+        process.terminate()
+    deadline = time.monotonic() + timeout
+    for process in workers:
+        process.join(max(0.0, deadline - time.monotonic()))
+        if process.is_alive():  # e.g. btcrpass ignores SIGTERM while autosaving
+            process.kill()
+
+
+def _seed_results(pending_seeds, jobs):
+    """Yield ``(seed, seed_argv, result)`` for each pending seed.
+
+    With more than one job the seeds run in a pool of worker processes, up to
+    *jobs* at a time, and results arrive in completion order.  Seeds are only
+    taken from *pending_seeds* as workers free up.  A seed whose worker died
+    outright yields a ``None`` result, as does one that raised.  Closing the
+    generator early (after a match, say) terminates any seeds still running.
+    On Ctrl-C the seeds still running yield ``None`` results before the
+    ``KeyboardInterrupt`` is raised.
+    """
+    if jobs == 1:
+        for seed_to_try, seed_argv in pending_seeds:
+            yield seed_to_try, seed_argv, _run_seed(seed_argv)
         return
 
-    directory = os.path.dirname(progress_filename)
-    if directory:
+    pool = _worker_pool(jobs)
+    running = {}
+    try:
+        seeds = iter(pending_seeds)
+        while True:
+            for seed_to_try, seed_argv in seeds:
+                try:
+                    future = pool.submit(_run_seed, seed_argv)
+                except BrokenProcessPool:
+                    # A worker was killed (by the OOM killer, say); the seeds
+                    # it took down with it are reported below, so carry on
+                    # with a fresh pool
+                    pool.shutdown(wait=True)
+                    pool = _worker_pool(jobs)
+                    future = pool.submit(_run_seed, seed_argv)
+                running[future] = seed_to_try, seed_argv
+                if len(running) == jobs:
+                    break
+            if not running:
+                return
+            try:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+            except KeyboardInterrupt:
+                # Ctrl-C reaches the workers too, and they exit; report the
+                # seeds they were running as failed before passing it on
+                _stop_workers()
+                interrupted, running = list(running.values()), {}
+                for seed_to_try, seed_argv in interrupted:
+                    yield seed_to_try, seed_argv, None
+                raise
+            for future in done:
+                try:
+                    seed_result = future.result()
+                except BrokenProcessPool:
+                    seed_result = None
+                yield (*running.pop(future), seed_result)
+    finally:
+        if running:
+            _stop_workers()
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+class _ProgressLog:
+    """Appends seed status lines to the batch progress file.
+
+    The file is opened on the first append and then kept open until
+    :meth:`close`.  Nothing is created if no entry is ever written.
+
+    Every entry is written to the file as soon as it is appended, so it is
+    visible to other batch workers and to batch_progress_report right away
+    and survives the process being killed.  Only the fsync, which guards
+    against a power loss, is batched: it runs once ``FSYNC_ENTRIES`` entries
+    or ``FSYNC_SECONDS`` have built up, straight after a MATCHED entry, and
+    on :meth:`close`.
+    """
+
+    FSYNC_ENTRIES = 64
+    FSYNC_SECONDS = 1.0
+
+    def __init__(self, progress_filename):
+        self.progress_filename = progress_filename
+        self._file = None
+        self._unavailable = not progress_filename
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def _open(self):
+        directory = os.path.dirname(self.progress_filename)
+        if directory:
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except OSError as exc:  # pragma: no cover - defensive programming
+                print(
+                    f"Unable to create directories for progress file '{self.progress_filename}': {exc}",
+                    file=sys.stderr,
+                )
+                return None
+
         try:
-            os.makedirs(directory, exist_ok=True)
+            return open(self.progress_filename, "a", encoding="utf-8", buffering=1)
         except OSError as exc:  # pragma: no cover - defensive programming
-            print(
-                f"Unable to create directories for progress file '{progress_filename}': {exc}",
-                file=sys.stderr,
-            )
+            print(f"Unable to update progress file '{self.progress_filename}': {exc}", file=sys.stderr)
+            return None
+
+    def append(self, seed, status, include_timestamp=False, arguments=None):
+        if self._unavailable:
             return
+        if self._file is None:
+            self._file = self._open()
+            if self._file is None:
+                self._unavailable = True
+                return
+
+        fields = [status, seed]
+        if include_timestamp:
+            fields.append(datetime.datetime.now().isoformat())
+        if arguments:
+            if isinstance(arguments, (list, tuple)):
+                argument_value = " ".join(shlex.quote(arg) for arg in arguments)
+            else:
+                argument_value = str(arguments)
+            fields.append(argument_value)
+
+        try:
+            # Line buffered, so this write reaches the OS immediately
+            self._file.write("\t".join(fields) + "\n")
+            self._unsynced += 1
+            if (
+                status == "MATCHED"
+                or self._unsynced >= self.FSYNC_ENTRIES
+                or time.monotonic() - self._last_sync >= self.FSYNC_SECONDS
+            ):
+                self._sync()
+        except OSError as exc:  # pragma: no cover - defensive programming
+            print(f"Unable to update progress file '{self.progress_filename}': {exc}", file=sys.stderr)
+
+    def _sync(self):
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        if self._file is not None:
+            try:
+                if self._unsynced:
+                    self._sync()
+            except OSError as exc:  # pragma: no cover - defensive programming
+                print(f"Unable to update progress file '{self.progress_filename}': {exc}", file=sys.stderr)
+            finally:
+                self._file.close()
+                self._file = None
 
-    try:
-        with open(progress_filename, "a", encoding="utf-8") as progress_file:
-            fields = [status, seed]
-            if include_timestamp:
-                fields.append(datetime.datetime.now().isoformat())
-            if arguments:
-                if isinstance(arguments, (list, tuple)):
-                    argument_value = " ".join(shlex.quote(arg) for arg in arguments)
-                else:
-                    argument_value = str(arguments)
-                fields.append(argument_value)
-            progress_file.write("\t".join(fields) + "\n")
-    except OSError as exc:  # pragma: no cover - defensive programming
-        print(f"Unable to update progress file '{progress_filename}': {exc}", file=sys.stderr)
 
 if __name__ == "__main__":
     (
@@ -225,6 +551,8 @@ if __name__ == "__main__":
         skip_completed,
         include_timestamp,
         include_arguments,
+        batch_jobs,
+        shard_by_hash,
     ) = _parse_batch_arguments(sys.argv)
 
     print()
@@ -232,154 +560,144 @@ if __name__ == "__main__":
 
     btcrseed.register_autodetecting_wallets()
 
+    completed_seeds = (
+        _load_completed_seeds(progress_filename) if skip_completed else _CompletedSeeds()
+    )
+
     try:
         with open(batch_filename, "r", encoding="utf-8") as batch_seed_file:
-            batch_seed_list = batch_seed_file.readlines()
+            # Lines are streamed straight into the work list, which keeps only
+            # this worker's seeds; reversing needs the whole file up front
+            batch_lines = batch_seed_file
+            if process_reverse:
+                batch_lines = reversed(batch_seed_file.readlines())
+            batch_seeds = _batch_work_list(
+                batch_lines, worker_ids, workers_total, completed_seeds, shard_by_hash
+            )
     except OSError as exc:
         print(f"Unable to open batch file '{batch_filename}': {exc}", file=sys.stderr)
         sys.exit(1)
 
-    if process_reverse:
-        batch_seed_list = list(reversed(batch_seed_list))
-
-    completed_seeds = (
-        _load_completed_seeds(progress_filename) if skip_completed else set()
-    )
-
-    seed_index = 0
     retval = 0
     match_found = False
+    pending_seeds = _PendingSeeds(
+        batch_seeds,
+        _limit_threads(sys.argv[1:], batch_jobs),
+        progress_filename,
+        skip_completed,
+        completed_seeds,
+    )
+    seed_results = _seed_results(pending_seeds, batch_jobs)
 
-    for mnemonic in batch_seed_list:
-        if _progress_contains_match(progress_filename):
-            print("Stopping: matched seed already recorded in progress file")
-            retval = 0
-            break
-
-        # Make a copy of the arguments
-        temp_argv = copy.deepcopy(sys.argv)
-
-        stripped_line = mnemonic.strip()
-        if not stripped_line or stripped_line.startswith('#'):
-            continue
-
-        seed_to_try = mnemonic.split("#")[0].strip()
-
-        if skip_completed and seed_to_try in completed_seeds:
-            print("Skipping Seed (already completed):", seed_to_try)
-            seed_index += 1
-            continue
-
-        if worker_ids is not None:
-            if (seed_index % workers_total) not in worker_ids:
-                seed_index += 1
+    progress_log = _ProgressLog(progress_filename)
+    try:
+        for seed_to_try, seed_argv, seed_result in seed_results:
+            if seed_result is None:
+                print("Generated Exception...")
+                progress_log.append(
+                    seed_to_try,
+                    "ERROR",
+                    include_timestamp=include_timestamp,
+                    arguments=seed_argv if include_arguments else None,
+                )
                 continue
 
-        seed_index += 1
-
-        # Split seeds from any comments
-        temp_argv.append("--mnemonic")
-        temp_argv.append(seed_to_try)
-
-        print("Running Seed:", seed_to_try)
-
-        try:
-            mnemonic_sentence, path_coin = btcrseed.main(temp_argv[1:])
-        except Exception:  # pragma: no cover - btcrseed failures are environment dependent
-            print("Generated Exception...")
-            _append_progress(
-                progress_filename,
-                seed_to_try,
-                "ERROR",
-                include_timestamp=include_timestamp,
-                arguments=temp_argv[1:] if include_arguments else None,
-            )
-            continue
-
-        if mnemonic_sentence:
-            success_alert.start_success_beep()
-            match_found = True
-            _append_progress(
-                progress_filename,
-                seed_to_try,
-                "MATCHED",
-                include_timestamp=include_timestamp,
-                arguments=temp_argv[1:] if include_arguments else None,
-            )
-            if skip_completed:
-                completed_seeds.add(seed_to_try)
-            if not btcrseed.tk_root:  # if the GUI is not being used
-                print()
-                print(
-                    "If this tool helped you to recover funds, please consider donating 1% of what you recovered, in your crypto of choice to:")
-                print("BTC: 37N7B7sdHahCXTcMJgEnHz7YmiR4bEqCrS ")
-                print("BCH: qpvjee5vwwsv78xc28kwgd3m9mnn5adargxd94kmrt ")
-                print("LTC: M966MQte7agAzdCZe5ssHo7g9VriwXgyqM ")
-                print("ETH: 0x72343f2806428dbbc2C11a83A1844912184b4243 ")
+            mnemonic_sentence, path_coin = seed_result
+
+            if mnemonic_sentence:
+                seed_results.close()  # stop any other seeds still running
+                success_alert.start_success_beep()
+                match_found = True
+                progress_log.append(
+                    seed_to_try,
+                    "MATCHED",
+                    include_timestamp=include_timestamp,
+                    arguments=seed_argv if include_arguments else None,
+                )
+                if skip_completed:
+                    completed_seeds.add(seed_to_try)
+                if not btcrseed.tk_root:  # if the GUI is not being used
+                    print()
+                    print(
+                        "If this tool helped you to recover funds, please consider donating 1% of what you recovered, in your crypto of choice to:")
+                    print("BTC: 37N7B7sdHahCXTcMJgEnHz7YmiR4bEqCrS ")
+                    print("BCH: qpvjee5vwwsv78xc28kwgd3m9mnn5adargxd94kmrt ")
+                    print("LTC: M966MQte7agAzdCZe5ssHo7g9VriwXgyqM ")
+                    print("ETH: 0x72343f2806428dbbc2C11a83A1844912184b4243 ")
 
-                # Selective Donation Addressess depending on path being recovered... (To avoid spamming the dialogue with shitcoins...)
-                # TODO: Implement this better with a dictionary mapping in seperate PY file with BTCRecover specific donation addys... (Seperate from YY Channel)
-                if path_coin == 28:
-                    print("VTC: vtc1qxauv20r2ux2vttrjmm9eylshl508q04uju936n ")
+                    # Selective Donation Addressess depending on path being recovered... (To avoid spamming the dialogue with shitcoins...)
+                    # TODO: Implement this better with a dictionary mapping in seperate PY file with BTCRecover specific donation addys... (Seperate from YY Channel)
+                    if path_coin == 28:
+                        print("VTC: vtc1qxauv20r2ux2vttrjmm9eylshl508q04uju936n ")
 
-                if path_coin == 22:
-                    print("MONA: mona1q504vpcuyrrgr87l4cjnal74a4qazes2g9qy8mv ")
+                    if path_coin == 22:
+                        print("MONA: mona1q504vpcuyrrgr87l4cjnal74a4qazes2g9qy8mv ")
 
-                if path_coin == 5:
-                    print("DASH: Xx2umk6tx25uCWp6XeaD5f7CyARkbemsZG ")
+                    if path_coin == 5:
+                        print("DASH: Xx2umk6tx25uCWp6XeaD5f7CyARkbemsZG ")
 
-                if path_coin == 121:
-                    print("ZEN: znUihTHfwm5UJS1ywo911mdNEzd9WY9vBP7 ")
+                    if path_coin == 121:
+                        print("ZEN: znUihTHfwm5UJS1ywo911mdNEzd9WY9vBP7 ")
 
-                if path_coin == 3:
-                    print("DOGE: DMQ6uuLAtNoe5y6DCpxk2Hy83nYSPDwb5T ")
+                    if path_coin == 3:
+                        print("DOGE: DMQ6uuLAtNoe5y6DCpxk2Hy83nYSPDwb5T ")
 
-                print()
-                print("Find me on Reddit @ https://www.reddit.com/user/Crypto-Guide")
-                print()
-                print(
-                    "You may also consider donating to Gurnec, who created and maintained this tool until late 2017 @ 3Au8ZodNHPei7MQiSVAWb7NB2yqsb48GW4")
-                print()
-                print("Seed found:", mnemonic_sentence)  # never dies from printing Unicode
+                    print()
+                    print("Find me on Reddit @ https://www.reddit.com/user/Crypto-Guide")
+                    print()
+                    print(
+                        "You may also consider donating to Gurnec, who created and maintained this tool until late 2017 @ 3Au8ZodNHPei7MQiSVAWb7NB2yqsb48GW4")
+                    print()
+                    print("Seed found:", mnemonic_sentence)  # never dies from printing Unicode
 
-            # print this if there's any chance of Unicode-related display issues
-            if any(ord(c) > 126 for c in mnemonic_sentence):
-                print("HTML Encoded Seed:", mnemonic_sentence.encode("ascii", "xmlcharrefreplace").decode())
-
-            if not btcrseed.tk_root:
-                success_alert.wait_for_user_to_stop()
-
-            if btcrseed.tk_root:      # if the GUI is being used
-                btcrseed.show_mnemonic_gui(mnemonic_sentence, path_coin)
-
-            retval = 0
-            break
-
-        elif mnemonic_sentence is None:
-            _append_progress(
-                progress_filename,
-                seed_to_try,
-                "ERROR",
-                include_timestamp=include_timestamp,
-                arguments=temp_argv[1:] if include_arguments else None,
-            )
-            retval = 1  # An error occurred or Ctrl-C was pressed inside btcrseed.main()
-
-        else:
-            _append_progress(
-                progress_filename,
-                seed_to_try,
-                "CHECKED",
-                include_timestamp=include_timestamp,
-                arguments=temp_argv[1:] if include_arguments else None,
-            )
-            if skip_completed:
-                completed_seeds.add(seed_to_try)
-            retval = 0  # "Seed not found" has already been printed to the console in btcrseed.main()
-
-        # Wait for any remaining child processes to exit cleanly (to avoid error messages from gc)
-        for process in multiprocessing.active_children():
-            process.join(1.0)
+                # print this if there's any chance of Unicode-related display issues
+                if any(ord(c) > 126 for c in mnemonic_sentence):
+                    print("HTML Encoded Seed:", mnemonic_sentence.encode("ascii", "xmlcharrefreplace").decode())
+
+                if not btcrseed.tk_root:
+                    success_alert.wait_for_user_to_stop()
+
+                if btcrseed.tk_root:      # if the GUI is being used
+                    btcrseed.show_mnemonic_gui(mnemonic_sentence, path_coin)
+
+                retval = 0
+                break
+
+            elif mnemonic_sentence is None:
+                progress_log.append(
+                    seed_to_try,
+                    "ERROR",
+                    include_timestamp=include_timestamp,
+                    arguments=seed_argv if include_arguments else None,
+                )
+                retval = 1  # An error occurred or Ctrl-C was pressed inside btcrseed.main()
+
+            else:
+                progress_log.append(
+                    seed_to_try,
+                    "CHECKED",
+                    include_timestamp=include_timestamp,
+                    arguments=seed_argv if include_arguments else None,
+                )
+                if skip_completed:
+                    completed_seeds.add(seed_to_try)
+                retval = 0  # "Seed not found" has already been printed to the console in btcrseed.main()
+
+            if batch_jobs == 1:
+                # Wait for any remaining child processes to exit cleanly (to avoid error messages from gc)
+                for process in multiprocessing.active_children():
+                    process.join(1.0)
+    except KeyboardInterrupt:
+        # With --batch-jobs, Ctrl-C stops the workers and lands here once the
+        # seeds they were running have been logged as errors
+        print("\nInterrupted", file=sys.stderr)
+        retval = 1
+    finally:
+        seed_results.close()
+        progress_log.close()
+
+    if pending_seeds.match_recorded:
+        retval = 0
 
     # Wait for any remaining child processes to exit cleanly (to avoid error messages from gc)
     for process in multiprocessing.active_children():
@@ -10,9 +10,12 @@ any seeds that appear to have been skipped.
 from __future__ import annotations
 
 import argparse
-from collections import Counter, defaultdict
+from collections import Counter
 from pathlib import Path
-from typing import DefaultDict, List, NamedTuple, Optional, Sequence, Set
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set
+
+# Progress files up to this size are read in one go; larger ones are streamed
+PROGRESS_READ_LIMIT = 100 * 1024 * 1024
 
 
 class BatchSeedEntry(NamedTuple):
@@ -86,28 +89,24 @@ def _load_batch_seeds(batch_path: Path, reverse: bool = False) -> Sequence[Batch
     return entries
 
 
-def _load_progress(progress_path: Path) -> Sequence[ProgressEntry]:
-    """Load progress entries from the progress file."""
-
-    entries: List[ProgressEntry] = []
+def _parse_progress_lines(lines: Iterable[str]) -> List[ProgressEntry]:
+    """Parse ``STATUS<TAB>SEED[<TAB>...]`` lines, skipping any without a seed."""
 
-    with progress_path.open("r", encoding="utf-8") as progress_file:
-        for line_number, line in enumerate(progress_file, start=1):
-            stripped = line.rstrip("\n")
-            if not stripped:
-                continue
+    return [
+        ProgressEntry(parts[0].strip(), seed, line_number)
+        for line_number, line in enumerate(lines, start=1)
+        if len(parts := line.rstrip("\n").split("\t")) >= 2 and (seed := parts[1].strip())
+    ]
 
-            parts = stripped.split("\t")
-            if len(parts) < 2:
-                continue
 
-            status, seed = parts[0].strip(), parts[1].strip()
-            if not seed:
-                continue
+def _load_progress(progress_path: Path) -> Sequence[ProgressEntry]:
+    """Load progress entries from the progress file."""
 
-            entries.append(ProgressEntry(status, seed, line_number))
+    if progress_path.stat().st_size > PROGRESS_READ_LIMIT:
+        with progress_path.open("r", encoding="utf-8") as progress_file:
+            return _parse_progress_lines(progress_file)
 
-    return entries
+    return _parse_progress_lines(progress_path.read_text(encoding="utf-8").split("\n"))
 
 
 def _determine_processed_positions(
@@ -119,17 +118,21 @@ def _determine_processed_positions(
     The progress log entries may not appear in the same order as the batch
     seeds. Instead of assuming an ordering, we count how many times each seed
     appears in the progress log and mark that many occurrences in the batch as
-    processed.
+    processed, using up one count per marked occurrence.
     """
 
-    progress_counts: Counter[str] = Counter(entry.seed for entry in progress_entries)
+    # A plain dict, so seeds without progress entries are a dict.get() miss
+    # rather than a call to Counter.__missing__
+    progress_counts: Dict[str, int] = dict(
+        Counter(entry.seed for entry in progress_entries)
+    )
     processed_positions: Set[int] = set()
-    seen_occurrences: DefaultDict[str, int] = defaultdict(int)
 
     for entry in batch_entries:
-        seen_occurrences[entry.seed] += 1
-        if progress_counts[entry.seed] >= seen_occurrences[entry.seed]:
+        remaining = progress_counts.get(entry.seed, 0)
+        if remaining:
             processed_positions.add(entry.position)
+            progress_counts[entry.seed] = remaining - 1
 
     return processed_positions
 
@@ -171,9 +174,8 @@ def main() -> None:
 
     if processed_positions:
         farthest_position = max(processed_positions)
-        farthest_entry = next(
-            entry for entry in batch_entries if entry.position == farthest_position
-        )
+        # Positions are numbered from 1 in batch order
+        farthest_entry = batch_entries[farthest_position - 1]
     else:
         farthest_position = 0
         farthest_entry = None
@@ -196,11 +198,8 @@ def main() -> None:
         f"{_format_seed(farthest_entry)} ({percent_complete:.2f}% of batch)"
     )
 
-    skipped_entries = [
-        entry
-        for entry in batch_entries
-        if entry.position < farthest_position and entry.position not in processed_positions
-    ]
+    skipped_positions = sorted(set(range(1, farthest_position)) - processed_positions)
+    skipped_entries = [batch_entries[position - 1] for position in skipped_positions]
 
     if skipped_entries:
         print()
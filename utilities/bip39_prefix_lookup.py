@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import argparse
+import bisect
 from pathlib import Path
 
 
@@ -32,8 +33,17 @@ def validate_prefix(prefix: str) -> str:
 
 
 def find_matching_words(prefix: str, wordlist: list[str]) -> list[str]:
-    """Return all words that start with *prefix* from the supplied *wordlist*."""
-    return [word for word in wordlist if word.startswith(prefix)]
+    """Return all words that start with *prefix* from the supplied *wordlist*.
+
+    *wordlist* must be sorted, as the BIP39 wordlists are, so the matches form
+    one contiguous run that can be located by bisection.
+    """
+    if not prefix:
+        return list(wordlist)
+    start = bisect.bisect_left(wordlist, prefix)
+    # The first string that sorts after every word beginning with prefix
+    end = bisect.bisect_left(wordlist, prefix[:-1] + chr(ord(prefix[-1]) + 1), start)
+    return wordlist[start:end]
 
 
 def build_parser() -> argparse.ArgumentParser:
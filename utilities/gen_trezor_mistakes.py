@@ -0,0 +1,85 @@
+"""Regenerate the frozen ``TREZOR_COMMON_MISTAKES`` literal.
+
+``btcrecover/trezor_common_mistakes.py`` ships the expanded mapping as a
+static dict so importing it does not rebuild the table.  Run this script after
+editing ``TREZOR_COMMON_MISTAKE_GROUPS`` to rewrite the generated block in
+place, or pass ``--check`` to verify that the literal is up to date.
+"""
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+
+
+MODULE_PATH = Path(__file__).resolve().parents[1] / "btcrecover" / "trezor_common_mistakes.py"
+BEGIN_MARKER = "# BEGIN GENERATED TREZOR_COMMON_MISTAKES"
+END_MARKER = "# END GENERATED TREZOR_COMMON_MISTAKES"
+
+
+def load_module():
+    """Load the mistakes module straight from its file, without btcrecover's package imports."""
+    spec = importlib.util.spec_from_file_location("_trezor_common_mistakes", MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _quote(word: str) -> str:
+    return '"' + word.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def render_mapping(mapping: Dict[str, Tuple[str, ...]]) -> str:
+    """Return the source for the generated block, markers included."""
+    lines = [
+        BEGIN_MARKER,
+        "# Produced by utilities/gen_trezor_mistakes.py; do not edit by hand.",
+        "TREZOR_COMMON_MISTAKES: Dict[str, Tuple[str, ...]] = {",
+    ]
+    for word, alternatives in mapping.items():
+        values = ", ".join(_quote(alternative) for alternative in alternatives)
+        if len(alternatives) == 1:
+            values += ","
+        lines.append(f"    {_quote(word)}: ({values}),")
+    lines.append("}")
+    lines.append(END_MARKER)
+    return "\n".join(lines)
+
+
+def regenerate(source: str, block: str) -> str:
+    """Replace the generated block inside *source* with *block*."""
+    start = source.index(BEGIN_MARKER)
+    end = source.index(END_MARKER, start) + len(END_MARKER)
+    return source[:start] + block + source[end:]
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit with an error instead of rewriting when the literal is stale",
+    )
+    args = parser.parse_args(argv)
+
+    module = load_module()
+    mapping = module._build_mistake_mapping(module.TREZOR_COMMON_MISTAKE_GROUPS)
+    source = MODULE_PATH.read_text(encoding="utf-8")
+    updated = regenerate(source, render_mapping(mapping))
+
+    if updated == source:
+        print(f"{MODULE_PATH.name} is up to date ({len(mapping)} words)")
+        return 0
+    if args.check:
+        print(f"{MODULE_PATH.name} is stale; rerun {Path(__file__).name}", file=sys.stderr)
+        return 1
+
+    MODULE_PATH.write_text(updated, encoding="utf-8")
+    print(f"Rewrote {MODULE_PATH.name} ({len(mapping)} words)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
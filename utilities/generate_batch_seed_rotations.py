@@ -56,18 +56,15 @@ def validate_mnemonic(words: Iterable[str]) -> list[str]:
 
 
 def generate_rotations(words: list[str]) -> list[str]:
-    rotations = []
+    # Every rotation is a window into the mnemonic repeated twice
     total = len(words)
-    for index in range(total):
-        rotated = words[index:] + words[:index]
-        rotations.append(" ".join(rotated))
-    return rotations
+    doubled = words + words
+    return [" ".join(doubled[index:index + total]) for index in range(total)]
 
 
 def write_batch_file(rotations: Iterable[str], output_path: Path) -> Path:
     with output_path.open("w", encoding="utf-8") as handle:
-        for line in rotations:
-            handle.write(f"{line}\n")
+        handle.write("".join(f"{line}\n" for line in rotations))
     return output_path
 
 
@@ -34,11 +34,11 @@ def prompt_index() -> int:
 
 def write_batch_file(seed_words: list[str], index: int, wordlist: list[str]) -> Path:
     output_path = DEFAULT_OUTPUT
-    with output_path.open("w", encoding="utf-8") as fh:
-        for candidate in wordlist:
-            updated = list(seed_words)
-            updated[index] = candidate
-            fh.write(" ".join(updated) + "\n")
+    # Only one position varies, so the words around it are joined just once
+    prefix = " ".join(seed_words[:index] + [""])
+    suffix = " ".join([""] + seed_words[index + 1:])
+    with output_path.open("w", encoding="utf-8", buffering=1 << 16) as fh:
+        fh.write("\n".join(prefix + candidate + suffix for candidate in wordlist) + "\n")
     return output_path
 
 
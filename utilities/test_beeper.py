@@ -5,8 +5,9 @@ from __future__ import annotations
 import argparse
 import os
 import sys
-import time
+import threading
 from pathlib import Path
+from types import ModuleType
 
 
 if "btcrecover" not in sys.modules:
@@ -16,10 +17,27 @@ if "btcrecover" not in sys.modules:
     if str(repo_root) not in sys.path:
         sys.path.insert(0, str(repo_root))
 
-from btcrecover import success_alert
 
+def _load_success_alert() -> ModuleType:
+    # Importing btcrecover loads the whole recovery package, so it is left
+    # until the arguments have been accepted (or the help text needs it)
+    from btcrecover import success_alert
 
-def _run_success_demo() -> None:
+    return success_alert
+
+
+class _HelpFormatter(argparse.HelpFormatter):
+    """Fills in the default console paths only when the help is printed."""
+
+    def _get_help_string(self, action: argparse.Action) -> str:
+        help_string = super()._get_help_string(action)
+        if "{default_console_paths}" in help_string:
+            default_paths = os.pathsep.join(_load_success_alert().PC_SPEAKER_DEFAULT_CONSOLE_PATHS)
+            help_string = help_string.replace("{default_console_paths}", default_paths)
+        return help_string
+
+
+def _run_success_demo(success_alert: ModuleType) -> None:
     print(
         "Starting success alert demo. The alert plays two beeps 1.5 seconds apart "
         "and repeats every 10 seconds."
@@ -34,21 +52,27 @@ def _run_success_demo() -> None:
         success_alert.set_beep_on_find(False)
 
 
-def _run_failure_demo() -> None:
+def _run_failure_demo(success_alert: ModuleType) -> threading.Event:
     print("Emitting a single failure beep...")
     success_alert.set_beep_on_find(True)
     try:
-        success_alert.beep_failure_once()
+        return success_alert.beep_failure_once()
     finally:
         success_alert.set_beep_on_find(False)
 
 
+def _console_paths(value: str) -> tuple[str, ...] | None:
+    """Split a --console-device value on the OS path separator."""
+    return tuple(filter(None, value.split(os.pathsep))) if value else None
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
         description=(
             "Play the success and/or failure alert beeps exactly as the recovery "
             "tool would when --beep-on-find is enabled."
-        )
+        ),
+        formatter_class=_HelpFormatter,
     )
     parser.add_argument(
         "--pc-speaker",
@@ -62,11 +86,12 @@ def main(argv: list[str] | None = None) -> int:
     )
     parser.add_argument(
         "--console-device",
+        type=_console_paths,
         metavar="PATH",
         help=(
             "Optional console device to use for PC speaker access (defaults to "
-            + os.pathsep.join(success_alert.PC_SPEAKER_DEFAULT_CONSOLE_PATHS)
-            + "). Use the OS path separator to provide multiple candidates."
+            "{default_console_paths}). Use the OS path separator to provide "
+            "multiple candidates."
         ),
     )
     parser.add_argument(
@@ -81,15 +106,11 @@ def main(argv: list[str] | None = None) -> int:
     )
 
     args = parser.parse_args(argv)
+    success_alert = _load_success_alert()
 
     if args.pc_speaker:
-        console_paths = None
-        if args.console_device:
-            console_paths = tuple(
-                path for path in args.console_device.split(os.pathsep) if path
-            )
         pcspeaker_ready = success_alert.configure_pc_speaker(
-            True, console_paths=console_paths
+            True, console_paths=args.console_device
         )
         if not pcspeaker_ready:
             print(
@@ -100,14 +121,15 @@ def main(argv: list[str] | None = None) -> int:
         success_alert.configure_pc_speaker(False)
 
     if args.mode in {"failure", "both"}:
-        _run_failure_demo()
+        beep_done = _run_failure_demo(success_alert)
         if args.mode == "both":
-            # Give the failure beep time to finish on terminals that queue BEL.
-            time.sleep(0.5)
+            # Let the failure beep finish before the success alert starts,
+            # without stalling for long on terminals that queue BEL.
+            beep_done.wait(timeout=0.5)
             print()
 
     if args.mode in {"success", "both"}:
-        _run_success_demo()
+        _run_success_demo(success_alert)
 
     return 0
 